@@ -2,6 +2,7 @@
 """
 This module starts a Flask web application.
 """
+from api.v1.json_providers import json_provider
 from api.v1.views import app_views
 from flask import Flask, jsonify, make_response
 from flask_cors import CORS
@@ -10,6 +11,7 @@ import os
 
 
 app = Flask(__name__)
+app.json = json_provider(app)
 app.register_blueprint(app_views)
 CORS(app, resources={r"/*": {"origins": "0.0.0.0"}})
 
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+"""
+This module contains the JSON providers the API can encode and decode
+JSON with, chosen by HBNB_API_JSON (orjson if installed, or stdlib).
+"""
+from datetime import datetime
+from flask.json.provider import DefaultJSONProvider
+from models.base_model import time
+from os import getenv
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def model_default(o):
+    """
+    returns a JSON-encodable value for o, writing datetimes the way
+    to_dict() does
+    """
+    if isinstance(o, datetime):
+        return o.strftime(time)
+    return DefaultJSONProvider.default(o)
+
+
+class ModelJSONProvider(DefaultJSONProvider):
+    """
+    standard library JSON provider writing datetimes like to_dict()
+    """
+    default = staticmethod(model_default)
+
+
+class OrjsonProvider(ModelJSONProvider):
+    """
+    JSON provider built on orjson, which encodes and decodes in native
+    code and handles UUIDs itself
+    """
+    options = 0
+    if orjson is not None:
+        options = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(self, obj, **kwargs):
+        """
+        returns obj serialized to a JSON string
+        """
+        return self.dumpb(obj, **kwargs).decode()
+
+    def dumpb(self, obj, indent=None, **kwargs):
+        """
+        returns obj serialized to JSON bytes, compact unless indent is
+        given
+        """
+        option = self.options
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def loads(self, s, **kwargs):
+        """
+        returns the object deserialized from the JSON string or bytes s
+        """
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """
+        returns a JSON response of the arguments, as jsonify does
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = ((self.compact is None and self._app.debug) or
+                  self.compact is False)
+        return self._app.response_class(self.dumpb(obj, indent=indent) +
+                                        b"\n", mimetype=self.mimetype)
+
+
+providers = {"stdlib": ModelJSONProvider}
+if orjson is not None:
+    providers["orjson"] = OrjsonProvider
+
+
+def json_provider(app):
+    """
+    returns the provider named by HBNB_API_JSON for app, orjson by
+    default and the standard library one if orjson is not installed
+    """
+    name = getenv("HBNB_API_JSON", "orjson")
+    return providers.get(name, ModelJSONProvider)(app)
@@ -4,6 +4,7 @@ This module creates a new view for Amenity objects
 to handle all default RestFul API actions.
 """
 from api.v1.views import app_views
+from api.v1.views.fragments import forget, jsonify_object, jsonify_page
 from flask import jsonify, abort, request
 from models import storage
 from models.amenity import Amenity
@@ -15,18 +16,9 @@ def get_all_amenities():
     """
     retrieves list of all Amenity objects
     """
-    amenities = []
-    """Initializes an empty list to store Amenity objects in
-    JSON format"""
-    for amenity in storage.all(Amenity).values():
-        amenities.append(amenity.to_dict())
-        """iterates through all Amenity objects returned by
-        storage.all(Amenity).values(). Each Amenity object is
-        converted to a dictionary with to_dict(), and then is
-        appended to the amenities list"""
-    return jsonify(amenities)
-    """returning the amenities list as a JSON response
-    using jsonify()"""
+    return jsonify_page(Amenity)
+    """returns all Amenity objects in storage as a JSON list,
+    or the page of them asked for by ?limit=&after="""
 
 
 @app_views.route("/amenities/<amenity_id>", methods=["GET"],
@@ -39,9 +31,9 @@ def get_amenity_id(amenity_id):
     """fetches Amenity object from storage with a specified
     amenity_id"""
     if amenity:
-        return jsonify(amenity.to_dict())
-        """If the amenity is found, it is converted to a dictionary
-        and returned as a JSON response"""
+        return jsonify_object(amenity)
+        """If the amenity is found, it is returned as a JSON
+        response, or a 304 if the client already has it"""
     else:
         abort(404)
         """If the amenity isn't found, abort request with a 404
@@ -58,9 +50,11 @@ def delete_amenity(amenity_id):
     """fetches an amenity with a specified amenity_id"""
     if amenity:
         storage.delete(amenity)
+        forget(amenity)
         storage.save()
         return jsonify({})
         """if the amenity is found, it is deleted from storage,
+        its cached JSON is dropped by forget,
         the deletion is saved in storage, and then is returned
         as an empty json response"""
     else:
@@ -4,6 +4,7 @@ This module creates a new view for City objects
 to handle all default RestFul API actions.
 """
 from api.v1.views import app_views
+from api.v1.views.fragments import forget, jsonify_object, jsonify_page
 from flask import jsonify, abort, request
 from models import storage
 from models.state import State
@@ -20,14 +21,10 @@ def get_all_cities(state_id):
     """fetches a State object from storage using get method
     with a specified state_id"""
     if state:
-        cities_json = [city.to_dict() for city in state.cities]
-        return jsonify(cities_json)
-        """if the State object exists, iterates through each
-        city in state.cities and converts each city object into
-        a dictionary using to_dict() method. The resulting list
-        of dictionaries is assigned to a list called cities_json
-        Then, cities_json is returned as a JSON response with
-        jsonify"""
+        return jsonify_page(City, "state_id", state.id)
+        """if the State object exists, each of its cities, or the
+        page of them asked for by ?limit=&after=, is returned in a
+        JSON list response with jsonify_page"""
     else:
         abort(404)
         """if the state isn't found, abort the request and display
@@ -44,10 +41,10 @@ def get_city_id(city_id):
     """fetches a city from storage with a specific
     city_id using get method"""
     if city:
-        return jsonify(city.to_dict())
-        """If the city exists, to_dict() converts the
-        City object to a dictionary and is returned
-        as a JSON response using jsonify"""
+        return jsonify_object(city)
+        """If the city exists, the City object is returned
+        as a JSON response using jsonify_object, or a 304
+        if the client already has it"""
     else:
         abort(404)
         """If state object isn't found, abort request with
@@ -65,9 +62,11 @@ def delete_city(city_id):
     using get method"""
     if city:
         storage.delete(city)
+        forget(city)
         storage.save()
         return jsonify({})
-        """if the city object exists, delete the City from stoage.
+        """if the city object exists, delete the City from stoage
+        and drop its cached JSON with forget.
         save() saves the deletion in storage.
         jsonify({}) returns an empty JSON response"""
     else:
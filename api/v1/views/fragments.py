@@ -0,0 +1,219 @@
+#!/usr/bin/python3
+"""
+This module keeps the JSON encoding of each object served by the API
+so that, with a JSON provider encoding in Python, list responses, whole
+or a page at a time, are streamed by joining encoded fragments, and
+answers conditional GETs from the ids and updated_at of the objects
+before encoding anything.
+"""
+from collections import OrderedDict
+from datetime import timezone
+from flask import abort, current_app, jsonify, request, stream_with_context
+from models import storage
+from os import getenv
+from urllib.parse import urlencode
+import hashlib
+
+fragments = OrderedDict()
+max_fragments = int(getenv("HBNB_API_FRAGMENTS", 100000))
+
+
+def remember(key, stamp, data):
+    """
+    stores the JSON data of key at updated_at stamp, replacing that of
+    an older stamp and evicting the least recently used fragment past
+    HBNB_API_FRAGMENTS fragments
+    """
+    fragments[key] = (stamp, data)
+    try:
+        fragments.move_to_end(key)
+        while len(fragments) > max_fragments:
+            fragments.popitem(last=False)
+    except KeyError:
+        pass
+
+
+def forget(obj):
+    """
+    drops the cached JSON of obj, once it is deleted
+    """
+    fragments.pop(obj.__class__.__name__ + "." + obj.id, None)
+
+
+def fragmented():
+    """
+    returns True if list responses are joined from fragments: not in
+    debug mode, whose responses are indented, nor with a provider
+    encoding in native code such as orjson, which encodes a whole list
+    faster than its fragments can be looked up and joined
+    """
+    return not current_app.debug and not hasattr(current_app.json, "dumpb")
+
+
+def fragment(obj):
+    """
+    returns the JSON bytes of obj, encoding it again only when its id
+    or updated_at changed since it was last encoded
+    """
+    key = obj.__class__.__name__ + "." + obj.id
+    stamp = obj.updated_at
+    cached = fragments.get(key)
+    if cached is not None and cached[0] == stamp:
+        try:
+            fragments.move_to_end(key)
+        except KeyError:
+            pass
+        return cached[1]
+    json = current_app.json
+    if hasattr(json, "dumpb"):
+        data = json.dumpb(obj.to_dict())
+    else:
+        data = json.dumps(obj.to_dict(), separators=(",", ":")).encode()
+    remember(key, stamp, data)
+    return data
+
+
+def stream(objs, size=65536):
+    """
+    yields the JSON list of the dictionaries of objs in chunks of about
+    size bytes
+    """
+    chunk = [b"["]
+    length = 1
+    separator = b""
+    for obj in objs:
+        data = fragment(obj)
+        chunk.append(separator)
+        chunk.append(data)
+        separator = b","
+        length += len(data) + 1
+        if length >= size:
+            yield b"".join(chunk)
+            chunk = []
+            length = 0
+    chunk.append(b"]\n")
+    yield b"".join(chunk)
+
+
+def validators(objs):
+    """
+    returns the ETag and the Last-Modified datetime of a response made
+    of objs: a digest of their ids and updated_at in order, and the
+    latest updated_at (None without objects); updated_at is hashed as
+    the bytes it is pickled as, much faster to get than its text
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    latest = None
+    for obj in objs:
+        stamp = obj.updated_at
+        digest.update((obj.__class__.__name__ + "." + obj.id + "@").encode())
+        digest.update(stamp.__reduce__()[1][0])
+        if latest is None or stamp > latest:
+            latest = stamp
+    if latest is not None:
+        latest = latest.replace(tzinfo=timezone.utc)
+    return digest.hexdigest(), latest
+
+
+def conditional(objs, dated=True):
+    """
+    returns the ETag and Last-Modified of objs, and an empty 304
+    response carrying them if the request's If-None-Match or
+    If-Modified-Since shows the client already has them, else None;
+    unless dated is True, Last-Modified is None and If-Modified-Since
+    ignored, since the latest updated_at of a list does not move when
+    one of its objects is deleted
+    """
+    etag, modified = validators(objs)
+    if not dated:
+        modified = None
+    fresh = False
+    if request.method in ("GET", "HEAD"):
+        if request.if_none_match:
+            fresh = request.if_none_match.contains(etag)
+        else:
+            since = request.if_modified_since
+            fresh = (since is not None and modified is not None and
+                     modified.replace(microsecond=0) <= since)
+    if fresh:
+        return etag, modified, validate(current_app.response_class(
+            status=304), etag, modified)
+    return etag, modified, None
+
+
+def validate(response, etag, modified):
+    """
+    sets the ETag and Last-Modified headers of response and returns it
+    """
+    response.set_etag(etag)
+    if modified is not None:
+        response.last_modified = modified
+    return response
+
+
+def jsonify_object(obj):
+    """
+    returns the JSON response of the dictionary of obj, or a 304
+    response if the client already has it
+    """
+    etag, modified, not_modified = conditional([obj])
+    if not_modified is not None:
+        return not_modified
+    return validate(jsonify(obj.to_dict()), etag, modified)
+
+
+def jsonify_list(objs, conditional_get=True):
+    """
+    returns a response of the JSON list of the dictionaries of the
+    objects objs yields, with the bytes jsonify would send, streamed
+    from fragments if 'fragmented' and encoded at once otherwise; unless
+    conditional_get is False, objs is read up front to answer
+    conditional requests by ETag, with a 304 if the client already has
+    them
+    """
+    if conditional_get:
+        objs = list(objs)
+        etag, modified, not_modified = conditional(objs, False)
+        if not_modified is not None:
+            return not_modified
+    if fragmented():
+        response = current_app.response_class(
+            stream_with_context(stream(objs)),
+            mimetype=current_app.json.mimetype)
+    else:
+        response = jsonify([obj.to_dict() for obj in objs])
+    if conditional_get:
+        validate(response, etag, modified)
+    return response
+
+
+def jsonify_page(cls, attr=None, value=None):
+    """
+    returns a response of the JSON list of the cls objects, only
+    those whose foreign key attr is value if attr is given; with a limit
+    argument, only the page of at most limit objects, in id order, whose
+    id comes after the after argument, with the cursor of the next page
+    in the X-Next-Cursor and Link headers; answers conditional requests
+    like jsonify_list
+    """
+    limit = request.args.get("limit")
+    if limit is None:
+        if attr is None:
+            return jsonify_list(storage.all(cls).values())
+        return jsonify_list(storage.related(cls, attr, value))
+    if not limit.isdigit() or int(limit) < 1:
+        abort(400, "Invalid limit")
+    limit = int(limit)
+    objs = storage.page(cls, limit + 1, request.args.get("after"),
+                        attr, value)
+    etag, modified, not_modified = conditional(objs, False)
+    if not_modified is not None:
+        return not_modified
+    response = validate(jsonify_list(objs[:limit], False), etag, modified)
+    if len(objs) > limit:
+        cursor = objs[limit - 1].id
+        args = dict(request.args, after=cursor)
+        response.headers["X-Next-Cursor"] = cursor
+        response.headers["Link"] = '<{}?{}>; rel="next"'.format(
+            request.base_url, urlencode(args))
+    return response
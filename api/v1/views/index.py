@@ -2,7 +2,7 @@
 """
 This module contains the status and stats routes.
 """
-from flask import jsonify
+from flask import abort, jsonify
 from api.v1.views import app_views
 from models import storage
 from models.amenity import Amenity
@@ -49,3 +49,18 @@ def stats():
     each key-value pair (key, cls) it uses the count() method to count
     the number of instances of cls and stores the restult in stats_dict.
     stats_dict is then converted into a JSON response and returned"""
+
+
+@app_views.route("/stats/pool")
+def pool_stats():
+    """
+    returns the metrics of the database connection pool
+    """
+    if not hasattr(storage, "pool_stats"):
+        abort(404)
+        """only DBStorage keeps a connection pool, so the
+        other storage engines have no metrics to return"""
+    return jsonify(storage.pool_stats())
+    """returns how long checkouts waited for a connection
+    and how many connections are in use out of the pool
+    capacity, to size the workers against the pool"""
@@ -4,9 +4,10 @@ This module creates a new view for Place objects
 to handle all default RestFul API actions.
 """
 from api.v1.views import app_views
+from api.v1.views.fragments import forget, jsonify_list, jsonify_object
+from api.v1.views.fragments import jsonify_page
 from flask import jsonify, abort, request
 from models import storage
-from models.amenity import Amenity
 from models.city import City
 from models.place import Place
 from models.state import State
@@ -23,18 +24,10 @@ def get_all_places(city_id):
     """Fetches City from storage with a
     specified city_id"""
     if city:
-        places_json = []
-        """if City exists, initialize an empty list
-        called places_json to store places objects in
-        JSON format."""
-        for place in city.places:
-            places_json.append(place.to_dict())
-            """iterates through all Place objects that are
-            associated with City, the converts them into
-            dictionaries and appends it to the places_json
-            list."""
-        return jsonify(places_json)
-        """The places_json list is returned as a JSON response"""
+        return jsonify_page(Place, "city_id", city.id)
+        """if City exists, all Place objects associated with
+        City, or the page of them asked for by ?limit=&after=,
+        are returned as a JSON list response"""
     else:
         abort(404)
         """If the city was not found, abort the request
@@ -51,10 +44,10 @@ def get_place_id(place_id):
     """using a get method, fetches a Place object with a
     specified place_id."""
     if place:
-        return jsonify(place.to_dict())
-        """If the place object exists, it is converted
-        into a dictionary using to_dict(), then returned
-        as a JSON response with jsonify."""
+        return jsonify_object(place)
+        """If the place object exists, it is returned
+        as a JSON response with jsonify_object, or a 304
+        if the client already has it."""
     else:
         abort(404)
         """If place doesn't exist, abort request with 404
@@ -72,9 +65,11 @@ def delete_place(place_id):
     place_id."""
     if place:
         storage.delete(place)
+        forget(place)
         storage.save()
         return jsonify({})
-        """if Place exists, delete method delets the place.
+        """if Place exists, delete method delets the place
+        and forget drops its cached JSON.
         Then, the deletion is saved in Storage.
         jsonify{} returns an empty JSON response"""
     else:
@@ -182,46 +177,57 @@ def post_places_search():
     data = request.get_json()
     """get_json retrieves the JSON data from the request.
     now it will just be called data."""
-    places_json = []
-    """initializing an empty list to store Place objects in JSON format."""
+    if not isinstance(data, dict):
+        abort(400, "Not a JSON")
+    for key in ("states", "cities", "amenities"):
+        if not isinstance(data.get(key, []), list):
+            abort(400, "{} must be a list".format(key))
+            """the search is checked before the response starts,
+            since once it is streamed a bad value can no longer
+            turn into an error status."""
+    return jsonify_list(list(search_places(data)), False)
+    """The Place objects found are all gathered before
+    jsonify_list returns them as a JSON list, which may be
+    streamed, so that an error in the search still answers
+    with an error status."""
+
+
+def search_places(data):
+    """
+    yields the Place objects matching the states, cities and amenities
+    of the JSON search data
+    """
     if "states" in data:
         for state_id in data["states"]:
-            state = storage.get(State, state_id)
+            state = storage.get(State, state_id, load=["cities.places"])
             if state:
                 for city in state.cities:
-                    for place in city.places:
-                        places_json.append(place.to_dict())
-                        """checks if states is present in the JSON data.
-                        if so, iterates through each state_id and fetches
-                        the corresponding State object, and retrieves its
-                        Place objects through its City objects. Then,
-                        each Place object is converted to a dictionary
-                        and is appended to the places_json list."""
+                    yield from city.places
+                    """checks if states is present in the JSON data.
+                    if so, iterates through each state_id and fetches
+                    the corresponding State object, loading its City
+                    and Place objects along with it, and yields its
+                    Place objects through its City objects."""
 
     if "cities" in data:
         for city_id in data["cities"]:
-            city = storage.get(City, city_id)
+            city = storage.get(City, city_id, load=["places"])
             if city:
-                for place in city.places:
-                    places_json.append(place.to_dict())
-                    """checks if cities is in the JSON data.
-                    Iterates through each city_id, fetches the corresponding
-                    City object, and retrieves its Place objects. Each Place
-                    object is then converted to a dictionary with to_dict,
-                    then appended to the places_json list."""
-
-    if "amenities" in data:
+                yield from city.places
+                """checks if cities is in the JSON data.
+                Iterates through each city_id, fetches the corresponding
+                City object with its Place objects, and yields them."""
+
+    if data.get("amenities"):
+        places = [(place, {amenity.id for amenity in place.amenities})
+                  for place in storage.all(Place,
+                                           load=["amenities"]).values()]
         for amenity_id in data["amenities"]:
-            amenity = storage.get(Amenity, amenity_id)
-            if amenity:
-                for place in amenity.places:
-                    places_json.append(place.to_dict())
+            for place, amenity_ids in places:
+                if amenity_id in amenity_ids:
+                    yield place
                     """checks if amenities is in the JSON data.
-                    Iterates through each amenitiy_id, fetches the
-                    corresponding Amenity object, and retrieves its
-                    Place objects. The Place object is then converted
-                    into a dictionary and appended to the places_json list."""
-
-    return jsonify(places_json)
-    """The places_json list is returned as a JSON response
-    using jsonify()."""
+                    Reads the Amenity ids of every Place object once,
+                    loading their Amenity objects along with them,
+                    then iterates through each amenity_id and yields
+                    the Place objects that have that Amenity."""
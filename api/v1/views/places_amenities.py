@@ -4,6 +4,7 @@ This module defines API actions for linking Place and Amenity objects.
 """
 from flask import jsonify, abort, request
 from api.v1.views import app_views
+from api.v1.views.fragments import jsonify_list
 from models import storage
 from models.place import Place
 from models.amenity import Amenity
@@ -20,16 +21,7 @@ def place_amenities_get(place_id):
     """
     place = storage.get(Place, place_id)
     if place:
-        if storage_t == "db":
-            amenities = place.amenities
-        else:
-            for amenity_id in place.amenity_ids:
-                amenities.append(storage.get(Amenity, amenity_id))
-
-        amenities_json = []
-        for amenity in amenities:
-            amenities_json.append(amenity.to_dict())
-        return jsonify(amenities_json)
+        return jsonify_list(place.amenities)
     else:
         abort(404)
 
@@ -51,7 +43,8 @@ def place_amenity_delete(place_id, amenity_id):
                     abort(404)
             else:
                 if amenity_id in place.amenity_ids:
-                    place.amenity_ids.remove(amenity_id)
+                    place.amenity_ids = [i for i in place.amenity_ids
+                                         if i != amenity_id]
                 else:
                     abort(404)
         else:
@@ -59,7 +52,7 @@ def place_amenity_delete(place_id, amenity_id):
     else:
         abort(404)
 
-    storage.save()
+    place.save()
     return jsonify({}), 200
 
 
@@ -80,8 +73,8 @@ def place_amenity_link(place_id, amenity_id):
             else:
                 if amenity_id in place.amenity_ids:
                     return jsonify(amenity.to_dict()), 200
-                place.amenity_ids.append(amenity_id)
-            storage.save()
+                place.amenity_ids = place.amenity_ids + [amenity_id]
+            place.save()
             return jsonify(amenity.to_dict()), 201
         else:
             abort(404)
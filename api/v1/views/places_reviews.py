@@ -4,6 +4,7 @@ This module creates a new view for Place Review objects
 to handle all default RestFul API actions.
 """
 from api.v1.views import app_views
+from api.v1.views.fragments import forget, jsonify_object, jsonify_page
 from flask import jsonify, abort, request
 from models import storage
 from models.place import Place
@@ -21,15 +22,10 @@ def get_all_reviews(place_id):
     """using get method to fetch a place with
     a specified place_id"""
     if place:
-        reviews_json = []
-        for review in place.reviews:
-            reviews_json.append(review.to_dict())
-            """If the place object exists,
-            initialize an empty list called reviews_json to store
-            Review objects in JSON format"""
-        return jsonify(reviews_json)
-        """the reviews_json list is returned as a JSON
-        resonse using jsonify."""
+        return jsonify_page(Review, "place_id", place.id)
+        """If the place object exists, its Review objects, or the
+        page of them asked for by ?limit=&after=, are returned as a
+        JSON list response using jsonify_page."""
     else:
         abort(404)
         """If the place object was not found, abort the
@@ -46,10 +42,10 @@ def get_review_id(review_id):
     """using a get method to fetch a review by its
     review_id."""
     if review:
-        return jsonify(review.to_dict())
-        """If the review object exists, to_dict() converts
-        it into a dictionary and returned as a json response
-        using jsonify"""
+        return jsonify_object(review)
+        """If the review object exists, it is returned as a
+        json response using jsonify_object, or a 304 if the
+        client already has it"""
     else:
         abort(404)
         """if the review object doesn't exist
@@ -66,9 +62,11 @@ def delete_review(review_id):
     """fetches a review by its review_id using a get method"""
     if review:
         storage.delete(review)
+        forget(review)
         storage.save()
         return jsonify({}), 200
-        """if the review object exists, it is deleted.
+        """if the review object exists, it is deleted and
+        its cached JSON is dropped by forget.
         save() saves the deletion in storage.
         jsonify({}) returns an empty JSON response with a
         200 status message indicating successful deletion
@@ -4,6 +4,7 @@ This module creates a new view for State objects
 to handle all default RestFul API actions.
 """
 from api.v1.views import app_views
+from api.v1.views.fragments import forget, jsonify_object, jsonify_page
 from flask import jsonify, abort, request
 from models import storage
 from models.state import State
@@ -15,13 +16,9 @@ def get_all_states():
     """
     retrieves list of all State objects
     """
-    states_json = [state.to_dict() for state in storage.all(State).values()]
-    """creates a list of dictionaries called states_json.
-    Iterates through all State objects in storage.all(State.values(),
-    to_dict converts each State into a dictionary and adds it
-    to states_json list.)"""
-    return jsonify(states_json)
-    """jsonify turns the states_json list into a JSON response"""
+    return jsonify_page(State)
+    """jsonify_page turns all State objects in storage, or the page
+    of them asked for by ?limit=&after=, into a JSON list response"""
 
 
 @app_views.route("/states/<state_id>", methods=["GET"],
@@ -34,10 +31,10 @@ def get_state_id(state_id):
     """Using get method to fetch a State object with a
     specified state_id"""
     if state:
-        return jsonify(state.to_dict())
-        """If the state exists, its converted into a dictionary
-        using to_dict(), then returned as a JSON response using
-        jsonify."""
+        return jsonify_object(state)
+        """If the state exists, its returned as a JSON response
+        using jsonify_object, or a 304 if the client already
+        has it."""
     else:
         abort(404)
         """if the state doesn't exist, the request is aborted
@@ -55,9 +52,11 @@ def delete_state(state_id):
     from the storage object."""
     if state:
         storage.delete(state)
+        forget(state)
         storage.save()
         return jsonify({})
-        """If the State exists, the State is deleted and saved to storage.
+        """If the State exists, the State is deleted and saved to storage,
+        and its cached JSON is dropped by forget.
         Then, an empty json response is returned with jsonify({})"""
     else:
         abort(404)
@@ -4,6 +4,7 @@ This module creates a new view for User objects
 to handle all default RestFul API actions.
 """
 from api.v1.views import app_views
+from api.v1.views.fragments import forget, jsonify_object, jsonify_page
 from flask import jsonify, abort, request
 from models import storage
 from models.user import User
@@ -14,12 +15,7 @@ def get_all_users():
     """
     retrieves list of all User objects
     """
-    users_json = []
-    """ initializes empty list to store User objects in JSON format """
-    for user in storage.all(User).values():
-        users_json.append(user.to_dict())
-    """ iterates through all User objects in storage and appends """
-    return jsonify(users_json)
+    return jsonify_page(User)
     """ returns the list of User objects in JSON format """
 
 
@@ -31,7 +27,7 @@ def get_user_id(user_id):
     user = storage.get(User, user_id)
     """ uses 'get' to fetch a User with a specified user_id from storage """
     if user:
-        return jsonify(user.to_dict())
+        return jsonify_object(user)
         """ if user exists, the user object is returned,
             converted to a dictionary as a JSON response """
     else:
@@ -48,9 +44,11 @@ def delete_user(user_id):
     """ uses 'get' to fetch a User with a specified user_id from storage """
     if user:
         storage.delete(user)
+        forget(user)
         storage.save()
         return jsonify({})
         """ if user exists, the user object is deleted from storage,
+            its cached JSON is dropped by forget,
             storage is saved, and an empty dictionary is returned
             as a JSON response """
     else:
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+"""
+This module compares polling GET /api/v1/amenities for the full list
+with polling it with If-None-Match, answered by a 304.
+
+usage: ./benchmarks/bench_conditional.py [objects] [requests]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=10000, requests=50):
+    """
+    fills storage with objects amenities, then times requests calls of
+    the list endpoint without and with the ETag of the last response
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.amenity import Amenity
+    for i in range(objects):
+        storage.new(Amenity(name="amenity {}".format(i)))
+    storage.save()
+    from api.v1.app import app
+    client = app.test_client()
+    response = client.get("/api/v1/amenities")
+    size = len(response.get_data())
+    etag = response.headers["ETag"]
+
+    def rate(headers):
+        """
+        returns requests/sec and the bytes of the last body for
+        requests list calls sending headers
+        """
+        start = time.perf_counter()
+        for i in range(requests):
+            body = client.get("/api/v1/amenities", headers=headers).get_data()
+        return requests / (time.perf_counter() - start), len(body)
+
+    before = rate({})
+    after = rate({"If-None-Match": etag})
+    print("{} amenities, {} requests, {} bytes listed".format(
+        objects, requests, size))
+    for name, (speed, length) in (("full response", before),
+                                  ("If-None-Match", after)):
+        print("{:14} {:8.1f} req/s  {:8d} bytes".format(name, speed,
+                                                        length))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""
+This module compares DBStorage.all() and count() across all classes
+with the former loop of one query per class, over a connection that
+sleeps latency milliseconds before every statement.
+
+usage: HBNB_TYPE_STORAGE=db HBNB_MYSQL_USER=... HBNB_MYSQL_PWD=...
+       HBNB_MYSQL_HOST=... HBNB_MYSQL_DB=...
+       ./benchmarks/bench_db_round_trips.py [latency_ms] [objects]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(latency=20, objects=100, requests=20):
+    """
+    adds objects objects of each class, then times requests calls of
+    each way with latency milliseconds added to every statement
+    """
+    from models import storage
+    from models.amenity import Amenity
+    from models.city import City
+    from models.engine.db_storage import classes
+    from models.place import Place
+    from models.review import Review
+    from models.state import State
+    from models.user import User
+    from sqlalchemy import event
+    user = User(email="bench@hbnb.io", password="pwd")
+    state = State(name="Bench")
+    city = City(name="Bench", state_id=state.id)
+    place = Place(name="Bench", city_id=city.id, user_id=user.id)
+    for obj in (user, state, city, place):
+        storage.new(obj)
+    for i in range(objects):
+        storage.new(Amenity(name="amenity {}".format(i)))
+        storage.new(Review(text=str(i), place_id=place.id, user_id=user.id))
+    storage.save()
+    storage.close()
+    session = storage._DBStorage__session
+
+    def sleep(*args):
+        """
+        delays every statement by latency milliseconds
+        """
+        time.sleep(latency / 1000)
+    event.listen(storage._DBStorage__engine, "before_cursor_execute", sleep)
+
+    def loop_all():
+        """
+        reads every class with one query after another
+        """
+        return {"{}.{}".format(type(obj).__name__, obj.id): obj
+                for cls in classes.values() for obj in session.query(cls)}
+
+    def loop_count():
+        """
+        counts every class with one query after another
+        """
+        return sum(session.query(cls).count() for cls in classes.values())
+
+    def fresh_count():
+        """
+        counts every class without the counts kept by DBStorage
+        """
+        storage._DBStorage__counts = None
+        return storage.count()
+
+    def timed(call):
+        """
+        returns the mean milliseconds of requests calls, each in a new
+        session
+        """
+        start = time.perf_counter()
+        for i in range(requests):
+            call()
+            storage.close()
+        return (time.perf_counter() - start) / requests * 1000
+
+    print("{} ms per statement, {} classes".format(latency, len(classes)))
+    for name, before, after in (("all()", loop_all, storage.all),
+                                ("count()", loop_count, fresh_count)):
+        print("{:8} one query per class {:8.1f} ms  now {:8.1f} ms".format(
+            name, timed(before), timed(after)))
+    print("{:8} from the kept counts  {:8.3f} ms".format(
+        "count()", timed(storage.count)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+"""
+This module compares, with each JSON provider, GET /api/v1/amenities
+encoded by jsonify with the response joined from pre-encoded
+fragments, and with the encoding the API picks for that provider.
+
+usage: ./benchmarks/bench_fragments.py [objects] [requests]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=10000, requests=50):
+    """
+    fills storage with objects amenities, then times requests calls of
+    the list endpoint with each provider, encoded by jsonify, joined
+    from fragments and as the API serves it
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.amenity import Amenity
+    for i in range(objects):
+        storage.new(Amenity(name="amenity {}".format(i)))
+    storage.save()
+    from api.v1.app import app
+    from api.v1.json_providers import providers
+    from api.v1.views import fragments
+    client = app.test_client()
+
+    def rate(rounds=3):
+        """
+        returns the best requests/sec of rounds rounds of requests list
+        calls
+        """
+        client.get("/api/v1/amenities").get_data()
+        best = 0
+        for n in range(rounds):
+            start = time.perf_counter()
+            for i in range(requests):
+                client.get("/api/v1/amenities").get_data()
+            best = max(best, requests / (time.perf_counter() - start))
+        return best
+
+    fragmented = fragments.fragmented
+    print("{} amenities, {} requests".format(objects, requests))
+    for name, cls in providers.items():
+        app.json = cls(app)
+        for label, joined in (("jsonify(list of dicts)", False),
+                              ("joined fragments", True), ("served", None)):
+            if joined is None:
+                fragments.fragmented = fragmented
+            else:
+                fragments.fragmented = lambda: joined
+            fragments.fragments.clear()
+            print("{:8} {:22} {:8.1f} req/s".format(name, label, rate()))
+    fragments.fragmented = fragmented
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+"""
+This module counts the file writes and times a burst of concurrent
+POST /api/v1/states requests, with and without group commit.
+
+usage: ./benchmarks/bench_group_commit.py [objects] [requests]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=20000, requests=50):
+    """
+    fills a fresh file.json with objects amenities, then sends requests
+    POSTs at once from as many threads, each one saving storage
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.amenity import Amenity
+    from models.engine.file_storage import FileStorage
+    for i in range(objects):
+        storage.new(Amenity(name="amenity"))
+    storage.save()
+    from api.v1.app import app
+    writes = []
+    replace = os.replace
+
+    def counted(src, dst):
+        """
+        counts a file write and renames src to dst
+        """
+        writes.append(dst)
+        replace(src, dst)
+    os.replace = counted
+
+    def burst():
+        """
+        returns the file writes and seconds for requests concurrent POSTs
+        """
+        barrier = threading.Barrier(requests)
+
+        def post():
+            client = app.test_client()
+            barrier.wait()
+            client.post("/api/v1/states", json={"name": "State"})
+        threads = [threading.Thread(target=post) for i in range(requests)]
+        del writes[:]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return len(writes), time.perf_counter() - start
+
+    print("{} objects, {} concurrent POSTs".format(objects, requests))
+    for group in (False, True):
+        FileStorage._FileStorage__group_commit = group
+        print("group commit {!s:5}: {:4} writes {:8.2f} s".format(
+            group, *burst()))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+"""
+This module compares objects/sec built from to_dict() dictionaries by
+the constructor and by BaseModel.from_dicts, and times a reload.
+
+usage: ./benchmarks/bench_hydration.py [objects]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=100000):
+    """
+    builds objects reviews from their dictionaries both ways, then
+    reloads them from a fresh file.json
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.review import Review
+    dicts = [Review(place_id="p", user_id="u", text="review").to_dict()
+             for i in range(objects)]
+
+    def rate(build):
+        """
+        returns the objects/sec build makes from dicts
+        """
+        start = time.perf_counter()
+        build()
+        return objects / (time.perf_counter() - start)
+
+    print("{} reviews".format(objects))
+    print("Review(**d):        {:10.0f} objects/s".format(
+        rate(lambda: [Review(**d) for d in dicts])))
+    print("Review.from_dicts:  {:10.0f} objects/s".format(
+        rate(lambda: Review.from_dicts(dicts))))
+    for obj in Review.from_dicts(dicts):
+        storage.new(obj)
+    storage.save()
+    start = time.perf_counter()
+    storage.reload()
+    print("reload:             {:10.2f} s".format(
+        time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
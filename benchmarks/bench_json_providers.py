@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+"""
+This module times GET /api/v1/users with each JSON provider, encoding
+every user on each request (cold) and reusing the encoded fragments
+(warm).
+
+usage: ./benchmarks/bench_json_providers.py [objects] [requests]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=50000, requests=10):
+    """
+    fills storage with objects users, then times requests list calls
+    per provider
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.user import User
+    for i in range(objects):
+        storage.new(User(email="user{}@hbnb.io".format(i), password="pwd",
+                         first_name="Betty", last_name="Holberton"))
+    storage.save()
+    from api.v1 import json_providers
+    from api.v1.app import app
+    from api.v1.views import fragments
+    client = app.test_client()
+
+    def rate(cold, count=requests):
+        """
+        returns requests/sec for count list calls
+        """
+        start = time.perf_counter()
+        for i in range(count):
+            if cold:
+                fragments.fragments.clear()
+            client.get("/api/v1/users")
+        return count / (time.perf_counter() - start)
+
+    print("{} users, {} requests".format(objects, requests))
+    for name, cls in json_providers.providers.items():
+        app.json = cls(app)
+        print("{:7} cold {:6.2f} req/s  warm {:6.2f} req/s".format(
+            name, rate(True), rate(False)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
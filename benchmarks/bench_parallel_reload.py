@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+"""
+This module times FileStorage.reload() cold starts with 1, 2, 4 and 8
+HBNB_RELOAD_WORKERS.
+
+usage: ./benchmarks/bench_parallel_reload.py [megabytes]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from bench_reload_memory import generate
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(megabytes=100):
+    """
+    generates the file then imports models once per worker count in a
+    fresh process, which is what an API worker does at startup
+    """
+    os.chdir(tempfile.mkdtemp())
+    generate("file.json", megabytes)
+    print("file.json: {:.1f} MB, {} cpus".format(
+        os.path.getsize("file.json") / 1024 / 1024, os.cpu_count()))
+    for workers in (1, 2, 4, 8):
+        env = dict(os.environ, HBNB_RELOAD_WORKERS=str(workers),
+                   PYTHONPATH=root)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import models"], env=env,
+                       check=True)
+        print("{} workers: {:8.2f} s".format(
+            workers, time.perf_counter() - start))
+    os.remove("file.json")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
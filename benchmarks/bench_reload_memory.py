@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+"""
+This module compares the peak RSS of FileStorage.reload() reading
+file.json with json.load against the streaming reader.
+
+usage: ./benchmarks/bench_reload_memory.py [megabytes]
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+
+def generate(path, megabytes):
+    """
+    writes a file.json of about megabytes MB of reviews
+    """
+    size = megabytes * 1024 * 1024
+    with open(path, "w") as f:
+        f.write("{\n")
+        written = 0
+        while written < size:
+            rid = str(uuid.uuid4())
+            review = {"id": rid, "__class__": "Review",
+                      "created_at": "2017-03-25T02:17:06.000000",
+                      "updated_at": "2017-03-25T02:17:06.000000",
+                      "place_id": str(uuid.uuid4()),
+                      "user_id": str(uuid.uuid4()),
+                      "text": "A quiet place with a great view. " * 4}
+            line = json.dumps("Review." + rid) + ": " + json.dumps(review)
+            f.write(("," if written else "") + line + "\n")
+            written += len(line) + 2
+        f.write("}\n")
+
+
+def child(mode):
+    """
+    reloads file.json from the working directory and prints the
+    seconds taken and the peak RSS in MB
+    """
+    cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.engine.file_storage import classes
+    os.chdir(cwd)
+    start = time.perf_counter()
+    if mode == "json.load":
+        objects = storage.all()
+        with open("file.json", "r") as f:
+            jo = json.load(f)
+        for key in jo:
+            objects[key] = classes[jo[key]["__class__"]](**jo[key])
+    else:
+        storage.reload()
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print("{:10s} {:8.1f} s {:10.1f} MB".format(mode, elapsed, peak))
+
+
+def main(megabytes=1024):
+    """
+    generates the file then reloads it once per reader in a fresh process
+    """
+    os.chdir(tempfile.mkdtemp())
+    generate("file.json", megabytes)
+    print("file.json: {:.1f} MB".format(
+        os.path.getsize("file.json") / 1024 / 1024))
+    for mode in ("json.load", "streaming"):
+        subprocess.run([sys.executable, os.path.abspath(__file__),
+                        "--child", mode], check=True)
+    os.remove("file.json")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+    else:
+        main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,45 @@
+#!/usr/bin/python3
+"""
+This module compares the JSON and binary FileStorage formats on file
+size, full save time and reload time.
+
+usage: ./benchmarks/bench_serializers.py [objects]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=100000):
+    """
+    saves and reloads objects reviews with each serializer
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models.engine.file_storage import classes, formats
+    from models.review import Review
+    reviews = [Review(place_id="p", user_id="u", text="A quiet place.")
+               for i in range(objects)]
+    print("{} reviews".format(objects))
+    for name, serializer in formats.items():
+        start = time.perf_counter()
+        fragments = [("Review." + review.id, serializer.encode(review))
+                     for review in reviews]
+        with open("file", "w" + serializer.mode) as f:
+            serializer.write(f, fragments)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        with open("file", "r" + serializer.mode) as f:
+            loaded = [classes[value["__class__"]](**value)
+                      for key, value in serializer.iter_items(f)]
+        reloaded = time.perf_counter() - start
+        print("{:7s} {:8.1f} MB  save {:6.2f} s  reload {:6.2f} s".format(
+            name, os.path.getsize("file") / 1024 / 1024, saved, reloaded))
+        os.remove("file")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
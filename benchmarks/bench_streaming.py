@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+"""
+This module measures time to first byte, total time and peak Python
+memory of GET /api/v1/users built as one jsonify() response and
+streamed from fragments, as it is with the standard library provider.
+
+usage: ./benchmarks/bench_streaming.py [objects]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=100000):
+    """
+    fills storage with objects users, then reads the list endpoint
+    once each way after a warm-up request
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.user import User
+    for i in range(objects):
+        storage.new(User(email="user{}@hbnb.io".format(i), password="pwd"))
+    storage.save()
+    from api.v1.app import app
+    from api.v1.views import fragments
+    client = app.test_client()
+
+    def read(trace):
+        """
+        returns the seconds to the first chunk and in total, or the
+        peak MB allocated while reading the response if trace is True
+        """
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        response = client.get("/api/v1/users", buffered=False)
+        chunks = iter(response.response)
+        next(chunks)
+        first = time.perf_counter() - start
+        for chunk in chunks:
+            pass
+        response.close()
+        total = time.perf_counter() - start
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+            tracemalloc.stop()
+            return peak
+        return first, total
+
+    def measure():
+        """
+        returns the first byte and total seconds and the peak MB of one
+        request after a warm-up request
+        """
+        client.get("/api/v1/users").get_data()
+        return read(False) + (read(True),)
+
+    fragmented = fragments.fragmented
+    fragments.fragmented = lambda: False
+    before = measure()
+    fragments.fragmented = lambda: True
+    after = measure()
+    fragments.fragmented = fragmented
+    print("{} users".format(objects))
+    for name, (first, total, peak) in (("jsonify", before),
+                                       ("streamed", after)):
+        print("{:8} first byte {:6.3f} s  total {:6.3f} s  "
+              "peak {:7.1f} MB".format(name, first, total, peak))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""
+This module benchmarks API requests/sec in file storage mode, with the
+teardown reloading file.json after every request and with the teardown
+only reloading when file.json changed.
+
+usage: ./benchmarks/bench_teardown.py [objects] [requests]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=100000, requests=200):
+    """
+    fills a fresh file.json with objects reviews, then times requests
+    GET /api/v1/status calls before and after the conditional reload
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.review import Review
+    for i in range(objects):
+        storage.new(Review(place_id="p", user_id="u", text="review"))
+    storage.save()
+    from api.v1.app import app
+    client = app.test_client()
+
+    def rate():
+        """
+        returns requests/sec for requests status calls
+        """
+        start = time.perf_counter()
+        for i in range(requests):
+            client.get("/api/v1/status")
+        return requests / (time.perf_counter() - start)
+
+    close = storage.close
+    storage.close = storage.reload
+    before = rate()
+    storage.close = close
+    after = rate()
+    print("{} objects, {} requests".format(objects, requests))
+    print("reload on every teardown: {:10.1f} req/s".format(before))
+    print("reload only on change:    {:10.1f} req/s".format(after))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,66 @@
+#!/usr/bin/python3
+"""
+This module measures POST /api/v1/places/<place_id>/reviews latency with
+every save writing file.json and with the background flusher.
+
+usage: ./benchmarks/bench_write_behind.py [objects] [requests] [flush_ms]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+
+def main(objects=20000, requests=200, flush_ms=50):
+    """
+    fills a fresh file.json with objects reviews of one place, then
+    times requests POSTs of a review without and with HBNB_FILE_FLUSH_MS
+    """
+    os.chdir(tempfile.mkdtemp())
+    from models import storage
+    from models.engine.file_storage import FileStorage
+    from models.place import Place
+    from models.review import Review
+    from models.user import User
+    user = User(email="bench@hbnb.io", password="bench")
+    place = Place(name="bench", city_id="c", user_id=user.id)
+    storage.new(user)
+    storage.new(place)
+    for i in range(objects):
+        storage.new(Review(place_id=place.id, user_id=user.id, text="r"))
+    storage.save()
+    from api.v1.app import app
+    client = app.test_client()
+    url = "/api/v1/places/{}/reviews".format(place.id)
+
+    def latencies():
+        """
+        returns the milliseconds taken by each of requests POSTs
+        """
+        times = []
+        for i in range(requests):
+            start = time.perf_counter()
+            client.post(url, json={"user_id": user.id, "text": "review"})
+            times.append((time.perf_counter() - start) * 1000)
+        return sorted(times)
+
+    print("{} objects, {} requests".format(objects, requests))
+    for ms in (0, flush_ms):
+        FileStorage._FileStorage__flush_ms = ms
+        times = latencies()
+        print("HBNB_FILE_FLUSH_MS={:<4} mean {:7.2f} ms  p50 {:7.2f} ms  "
+              "p99 {:7.2f} ms".format(ms, statistics.mean(times),
+                                      times[len(times) // 2],
+                                      times[len(times) * 99 // 100]))
+    storage._FileStorage__finish()
+    FileStorage._FileStorage__flush_ms = 0
+    storage.reload()
+    print("reviews on disk after exit flush:", storage.count(Review))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -99,7 +99,7 @@ class HBNBCommand(cmd.Cmd):
         if args[0] in classes:
             if len(args) > 1:
                 key = f"{args[0]}.{args[1]}"
-                obj = models.storage.all().get(key)
+                obj = models.storage.all(args[0]).get(key)
                 if obj:
                     print(obj)
                 else:
@@ -119,8 +119,9 @@ class HBNBCommand(cmd.Cmd):
         elif args[0] in classes:
             if len(args) > 1:
                 key = args[0] + "." + args[1]
-                if key in models.storage.all():
-                    models.storage.all().pop(key)
+                obj = models.storage.all(args[0]).get(key)
+                if obj is not None:
+                    models.storage.delete(obj)
                     models.storage.save()
                 else:
                     print("** no instance found **")
@@ -158,7 +159,8 @@ class HBNBCommand(cmd.Cmd):
         elif args[0] in classes:
             if len(args) > 1:
                 k = args[0] + "." + args[1]
-                if k in models.storage.all():
+                obj = models.storage.all(args[0]).get(k)
+                if obj is not None:
                     if len(args) > 2:
                         if len(args) > 3:
                             if args[0] == "Place":
@@ -172,8 +174,8 @@ class HBNBCommand(cmd.Cmd):
                                         args[3] = float(args[3])
                                     except ValueError:
                                         args[3] = 0.0
-                            setattr(models.storage.all()[k], args[2], args[3])
-                            models.storage.all()[k].save()
+                            setattr(obj, args[2], args[3])
+                            obj.save()
                         else:
                             print("** value missing **")
                     else:
@@ -185,6 +187,20 @@ class HBNBCommand(cmd.Cmd):
         else:
             print("** class doesn't exist **")
 
+    def do_convert(self, arg):
+        """
+        rewrites the file storage in another format (json or binary)
+        """
+        args = shlex.split(arg)
+        if not hasattr(models.storage, "convert"):
+            print("** storage can't be converted **")
+        elif len(args) == 0:
+            print("** format missing **")
+        elif args[0] not in ("json", "binary"):
+            print("** format doesn't exist **")
+        else:
+            models.storage.convert(args[0])
+
 
 if __name__ == '__main__':
     HBNBCommand().cmdloop()
@@ -10,8 +10,10 @@ import sqlalchemy
 from sqlalchemy import Column, String, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
+import weakref
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
+dict_cache = weakref.WeakKeyDictionary()
 
 if models.storage_t == "db":
     Base = declarative_base()
@@ -38,11 +40,11 @@ class BaseModel:
                     setattr(self, key, value)
             if kwargs.get("created_at", None) and type(self.created_at) is str:
                 self.created_at = datetime.strptime(kwargs["created_at"], time)
-            else:
+            elif type(kwargs.get("created_at", None)) is not datetime:
                 self.created_at = datetime.utcnow()
             if kwargs.get("updated_at", None) and type(self.updated_at) is str:
                 self.updated_at = datetime.strptime(kwargs["updated_at"], time)
-            else:
+            elif type(kwargs.get("updated_at", None)) is not datetime:
                 self.updated_at = datetime.utcnow()
             if kwargs.get("id", None) is None:
                 self.id = str(uuid.uuid4())
@@ -51,6 +53,45 @@ class BaseModel:
             self.created_at = datetime.utcnow()
             self.updated_at = self.created_at
 
+    @classmethod
+    def from_dicts(cls, dicts):
+        """
+        returns a list of the instances built from each dictionary of
+        dicts the way __init__ builds them from keyword arguments, but
+        without running __init__ or __setattr__ per attribute
+        """
+        if models.storage_t == "db":
+            return [cls(**kwargs) for kwargs in dicts]
+        new = object.__new__
+        parse = datetime.fromisoformat
+        instances = []
+        for kwargs in dicts:
+            obj = new(cls)
+            attrs = obj.__dict__
+            attrs.update(kwargs)
+            attrs.pop("__class__", None)
+            for name in ("created_at", "updated_at"):
+                value = attrs.get(name)
+                if value and type(value) is str:
+                    attrs[name] = parse(value)
+                elif type(value) is not datetime:
+                    attrs[name] = datetime.utcnow()
+            if attrs.get("id") is None:
+                attrs["id"] = str(uuid.uuid4())
+            instances.append(obj)
+        return instances
+
+    if models.storage_t != "db":
+        def __setattr__(self, name, value):
+            """
+            sets an attribute and lets storage know it changed
+            """
+            super().__setattr__(name, value)
+            dict_cache.pop(self, None)
+            storage = getattr(models, "storage", None)
+            if storage is not None:
+                storage.touch(self, name)
+
     def __str__(self):
         """
         returns a string representation of BaseModel instance
@@ -63,14 +104,22 @@ class BaseModel:
         updates the 'updated_at' attribute with the current datetime
         """
         self.updated_at = datetime.utcnow()
+        dict_cache.pop(self, None)
         models.storage.new(self)
         models.storage.save()
 
     def to_dict(self):
         """
-        returns a dictionary containing all keys/values of __dict__
+        returns a dictionary containing all keys/values of __dict__,
+        without the relationships loaded in db mode; in file storage
+        modes the result is cached until an attribute is set or the
+        instance is saved
         """
-        new_dict = self.__dict__.copy()
+        cached = dict_cache.get(self)
+        if cached is not None:
+            return cached.copy()
+        attrs = self.__dict__.copy()
+        new_dict = attrs.copy()
         if "created_at" in new_dict:
             new_dict["created_at"] = new_dict["created_at"].strftime(time)
         if "updated_at" in new_dict:
@@ -78,6 +127,12 @@ class BaseModel:
         new_dict["__class__"] = self.__class__.__name__
         if "_sa_instance_state" in new_dict:
             del new_dict["_sa_instance_state"]
+            for key in self.__mapper__.relationships.keys():
+                new_dict.pop(key, None)
+        elif models.storage_t != "db":
+            dict_cache[self] = new_dict.copy()
+            if self.__dict__ != attrs:
+                dict_cache.pop(self, None)
         return new_dict
 
     def delete(self):
@@ -28,3 +28,12 @@ class City(BaseModel, Base):
         initializes a City instance
         """
         super().__init__(*args, **kwargs)
+
+    if models.storage_t != "db":
+        @property
+        def places(self):
+            """
+            getter attribute - returns list of Place instances
+            """
+            from models.place import Place
+            return models.storage.related(Place, "city_id", self.id)
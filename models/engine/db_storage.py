@@ -3,6 +3,7 @@
 Contains the class DBStorage
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import models
 from models.amenity import Amenity
 from models.base_model import BaseModel, Base
@@ -13,8 +14,13 @@ from models.state import State
 from models.user import User
 from os import getenv
 import sqlalchemy
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import create_engine, event, func, literal, select
+from sqlalchemy import union_all
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.orm import scoped_session, selectinload, sessionmaker
+from sqlalchemy.pool import QueuePool
+import threading
+import time
 
 classes = {"Amenity": Amenity,
            "City": City,
@@ -25,33 +31,142 @@ classes = {"Amenity": Amenity,
            }
 
 
+class MeteredQueuePool(QueuePool):
+    """
+    connection pool that records how long checkouts wait for a
+    connection and how many connections are in use at once
+    """
+
+    def __init__(self, *args, max_overflow=10, **kwargs):
+        """
+        initializes the pool and its metrics
+        """
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.__max_overflow = max_overflow
+        self.__metrics_lock = threading.Lock()
+        self.__checkouts = 0
+        self.__timeouts = 0
+        self.__wait = 0
+        self.__wait_max = 0
+        self.__peak = 0
+
+    def connect(self):
+        """
+        checks out a connection, timing the wait for it
+        """
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except TimeoutError:
+            with self.__metrics_lock:
+                self.__timeouts += 1
+            raise
+        wait = time.perf_counter() - start
+        in_use = self.checkedout()
+        with self.__metrics_lock:
+            self.__checkouts += 1
+            self.__wait += wait
+            self.__wait_max = max(self.__wait_max, wait)
+            self.__peak = max(self.__peak, in_use)
+        return conn
+
+    def capacity(self):
+        """
+        returns the most connections the pool opens at once, None
+        without a limit
+        """
+        if self.__max_overflow < 0:
+            return None
+        return self.size() + self.__max_overflow
+
+    def metrics(self):
+        """
+        returns a dictionary of the checkouts so far, their total and
+        longest wait in milliseconds, the checkouts that timed out, and
+        the connections in use now and at most, out of capacity (None
+        without a limit), with saturation the share of capacity in use
+        """
+        capacity = self.capacity()
+        in_use = self.checkedout()
+        with self.__metrics_lock:
+            return {"checkouts": self.__checkouts,
+                    "wait_ms": round(self.__wait * 1000, 3),
+                    "wait_max_ms": round(self.__wait_max * 1000, 3),
+                    "timeouts": self.__timeouts,
+                    "in_use": in_use,
+                    "peak": self.__peak,
+                    "capacity": capacity,
+                    "saturation": (round(in_use / capacity, 3)
+                                   if capacity else None)}
+
+
 class DBStorage:
     """
     manages storage of hbnb models in a database
     """
     __engine = None
     __session = None
+    __counts = None
+    __executor = None
 
     def __init__(self):
         """
         creates the engine self.__engine and session self.__session
         """
+        self.__counts_lock = threading.Lock()
+        self.__counts_ttl = float(getenv('HBNB_MYSQL_COUNTS_TTL', 10))
+        self.__counted = 0
+        self.__commits = 0
         HBNB_MYSQL_USER = getenv('HBNB_MYSQL_USER')
         HBNB_MYSQL_PWD = getenv('HBNB_MYSQL_PWD')
         HBNB_MYSQL_HOST = getenv('HBNB_MYSQL_HOST')
         HBNB_MYSQL_DB = getenv('HBNB_MYSQL_DB')
         HBNB_ENV = getenv('HBNB_ENV')
+        pool = {}
+        for option, env, kind in (("pool_size", "POOL_SIZE", int),
+                                  ("max_overflow", "MAX_OVERFLOW", int),
+                                  ("pool_timeout", "POOL_TIMEOUT", float),
+                                  ("pool_recycle", "POOL_RECYCLE", int),
+                                  ("pool_pre_ping", "POOL_PRE_PING", bool)):
+            value = getenv('HBNB_MYSQL_' + env)
+            if value:
+                if kind is bool:
+                    pool[option] = value.lower() in ("1", "true", "yes", "on")
+                else:
+                    pool[option] = kind(value)
+        self.__warm = int(getenv('HBNB_MYSQL_POOL_WARM',
+                                 pool.get("pool_size", 5)))
         self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
                                       format(HBNB_MYSQL_USER,
                                              HBNB_MYSQL_PWD,
                                              HBNB_MYSQL_HOST,
-                                             HBNB_MYSQL_DB))
+                                             HBNB_MYSQL_DB),
+                                      poolclass=MeteredQueuePool, **pool)
         if HBNB_ENV == "test":
             Base.metadata.drop_all(self.__engine)
 
-    def all(self, cls=None):
+    def __loaders(self, cls, load):
+        """
+        returns the query options that load, for every path of load like
+        "cities.places", each relationship along it with one more query
+        for all the objects at once instead of one query per object
+        """
+        options = []
+        for path in load or ():
+            option = None
+            target = cls
+            for name in path.split("."):
+                attr = getattr(target, name)
+                option = (selectinload(attr) if option is None
+                          else option.selectinload(attr))
+                target = attr.property.mapper.class_
+            options.append(option)
+        return options
+
+    def all(self, cls=None, load=None):
         """
-        returns a dictionary of all objects in the database
+        returns a dictionary of all objects in the database, loading
+        the relationships named by load along with objects of cls
         """
         new_dict = {}
 
@@ -59,16 +174,52 @@ class DBStorage:
             cls = classes.get(cls)
 
         if cls is not None:
-            for obj in self.__session.query(cls):
+            query = self.__session.query(cls)
+            for obj in query.options(*self.__loaders(cls, load)):
                 key = "{}.{}".format(type(obj).__name__, obj.id)
                 new_dict[key] = obj
         else:
-            for name, cls in classes.items():
-                for obj in self.__session.query(cls):
-                    key = f"{obj.__class__.__name__}.{obj.id}"
-                    new_dict[key] = obj
+            for obj in self.__all_classes():
+                key = f"{obj.__class__.__name__}.{obj.id}"
+                new_dict[key] = obj
         return new_dict
 
+    def __fetch(self, cls):
+        """
+        returns the list of all cls objects, read in a session of its own
+        """
+        session = self.__factory()
+        try:
+            return session.query(cls).all()
+        finally:
+            session.close()
+
+    def __all_classes(self):
+        """
+        returns the objects of every class, queried in parallel on
+        pooled connections unless the session holds changes those
+        connections would not see
+        """
+        session = self.__session
+        if (session.new or session.dirty or session.deleted or
+                "counts" in session.info):
+            return [obj for cls in classes.values()
+                    for obj in session.query(cls)]
+        with self.__counts_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(len(classes))
+        objs = []
+        identity = session.identity_map
+        with session.no_autoflush:
+            for fetched in self.__executor.map(self.__fetch,
+                                               classes.values()):
+                for obj in fetched:
+                    held = identity.get(sqlalchemy.inspect(obj).key)
+                    if held is None:
+                        held = session.merge(obj, load=False)
+                    objs.append(held)
+        return objs
+
     def new(self, obj):
         """
         creates a new object in the database
@@ -90,35 +241,148 @@ class DBStorage:
 
     def reload(self):
         """
-        creates all tables and a new session
+        creates all tables and a new session, drops the class counts so
+        that they are read again from the database, and opens
+        HBNB_MYSQL_POOL_WARM connections (the pool size by default, at
+        most its capacity) in the pool ahead of the first requests
         """
         Base.metadata.create_all(self.__engine)
         sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
+        event.listen(sess_factory, "after_flush", self.__flushed)
+        event.listen(sess_factory, "after_commit", self.__committed)
+        event.listen(sess_factory, "after_rollback", self.__rolled_back)
+        self.__factory = sess_factory
         Session = scoped_session(sess_factory)
         self.__session = Session
+        with self.__counts_lock:
+            self.__counts = None
+        warm = self.__warm
+        capacity = self.__engine.pool.capacity()
+        if capacity is not None:
+            warm = min(warm, capacity)
+        conns = []
+        try:
+            for i in range(warm):
+                conns.append(self.__engine.connect())
+        finally:
+            for conn in conns:
+                conn.close()
 
-    def get(self, cls, id):
+    def get(self, cls, id, load=None):
         """
-        retrieves one object based on class and ID
+        retrieves one object based on class and ID, loading the
+        relationships named by load along with it
         """
         if cls in classes.values():
-            return self.__session.query(cls).filter_by(id=id).first()
+            return self.__session.query(cls).options(
+                *self.__loaders(cls, load)).filter_by(id=id).first()
         else:
             return None
 
+    def related(self, cls, attr, value):
+        """
+        returns the list of cls objects whose foreign key attr is value
+        """
+        if cls in classes.values():
+            return self.__session.query(cls).filter(
+                getattr(cls, attr) == value).all()
+        return []
+
+    def page(self, cls, limit, after=None, attr=None, value=None):
+        """
+        returns, in id order, at most limit cls objects whose id comes
+        after the id after, only those whose foreign key attr is value
+        if attr is given
+        """
+        if cls not in classes.values():
+            return []
+        query = self.__session.query(cls)
+        if attr is not None:
+            query = query.filter(getattr(cls, attr) == value)
+        if after is not None:
+            query = query.filter(cls.id > after)
+        return query.order_by(cls.id).limit(limit).all()
+
+    def __flushed(self, session, context):
+        """
+        records in session how many objects of each class its flush
+        added and deleted, to be counted once it commits
+        """
+        delta = session.info.setdefault("counts", {})
+        for obj in session.new:
+            name = type(obj).__name__
+            delta[name] = delta.get(name, 0) + 1
+        for obj in session.deleted:
+            name = type(obj).__name__
+            delta[name] = delta.get(name, 0) - 1
+
+    def __committed(self, session):
+        """
+        adds the objects session added and deleted to the class counts
+        """
+        delta = session.info.pop("counts", {})
+        with self.__counts_lock:
+            self.__commits += 1
+            if self.__counts is not None:
+                for name, change in delta.items():
+                    self.__counts[name] = self.__counts.get(name, 0) + change
+
+    def __rolled_back(self, session):
+        """
+        forgets the objects session added and deleted
+        """
+        session.info.pop("counts", None)
+
+    def __totals(self):
+        """
+        returns the number of committed objects of each class, read again
+        from the database in one query once older than
+        HBNB_MYSQL_COUNTS_TTL seconds so that commits of other processes
+        are picked up
+        """
+        with self.__counts_lock:
+            if (self.__counts is not None and
+                    time.monotonic() < self.__counted + self.__counts_ttl):
+                return dict(self.__counts)
+            commits = self.__commits
+        query = union_all(*[select(literal(name), func.count())
+                            .select_from(cls)
+                            for name, cls in classes.items()])
+        with self.__engine.connect() as conn:
+            counts = dict(conn.execute(query).all())
+        with self.__counts_lock:
+            if self.__commits == commits:
+                self.__counts = dict(counts)
+                self.__counted = time.monotonic()
+        return counts
+
     def count(self, cls=None):
         """
-        counts the number of objects in storage of a certain class
+        counts the number of objects in storage of a certain class, from
+        the class counts and the uncommitted changes of the session
         """
         if cls is None:
-            return sum(self.count(cls) for cls in classes.values())
-        if cls in classes.values():
-            return self.__session.query(cls).count()
+            names = set(classes)
+        elif cls in classes.values():
+            names = {cls.__name__}
         else:
             return 0
+        totals = self.__totals()
+        delta = self.__session.info.get("counts", {})
+        count = sum(totals[name] + delta.get(name, 0) for name in names)
+        count += sum(type(obj).__name__ in names for obj in self.__session.new)
+        count -= sum(type(obj).__name__ in names
+                     for obj in self.__session.deleted)
+        return count
 
     def close(self):
         """
         closes the current session
         """
         self.__session.remove()
+
+    def pool_stats(self):
+        """
+        returns the metrics of the connection pool
+        """
+        return self.__engine.pool.metrics()
@@ -3,14 +3,26 @@
 Contains the FileStorage class
 """
 
+import atexit
+import bisect
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import json
+import logging
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
+from models.engine.serializers import BinarySerializer, JSONSerializer
+from models.engine.serializers import iter_items
+from models.engine.locks import FileLock, ReadWriteLock
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
+import multiprocessing
+import os
+import threading
+import zlib
 
 classes = {"Amenity": Amenity,
            "BaseModel": BaseModel,
@@ -21,55 +33,723 @@ classes = {"Amenity": Amenity,
            "User": User
            }
 
+foreign_keys = ("state_id", "city_id", "place_id", "user_id")
+
+formats = {"json": JSONSerializer(),
+           "binary": BinarySerializer(classes)
+           }
+
+
+def hydrate(items, size=1000):
+    """
+    yields a (key, object) pair for each (key, dictionary) pair of
+    items, building the objects of each run of one class in bulk
+    """
+    items = iter(items)
+    while True:
+        batch = list(itertools.islice(items, size))
+        if not batch:
+            return
+        for name, run in itertools.groupby(
+                batch, lambda item: item[1]["__class__"]):
+            keys, dicts = zip(*run)
+            yield from zip(keys, classes[name].from_dicts(dicts))
+
+
+def load_chunk(lines):
+    """
+    decodes lines of a one-object-per-line JSON file and returns the
+    (key, object) pairs they hold
+    """
+    jo = json.loads("{" + "".join(lines).rstrip().rstrip(",") + "}")
+    return list(hydrate(jo.items()))
+
+
+class ObjectIndex(dict):
+    """
+    dictionary of objects keyed by <class name>.<id> that keeps a
+    per-class bucket, the foreign key reverse indexes and, once asked
+    for, the sorted keys of each class and of each reverse index in
+    step with their contents
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        initializes the index, its class buckets and its reverse indexes
+        """
+        super().__init__()
+        self.buckets = {}
+        self.links = {}
+        self.__linked = {}
+        self.__sorted = {}
+        self.__sorted_links = {}
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key, obj):
+        """
+        stores obj under key, in the bucket of its class and under
+        each of its foreign keys
+        """
+        if key in self:
+            self.__unlink(key)
+        elif key.split(".")[0] in self.__sorted:
+            bisect.insort(self.__sorted[key.split(".")[0]], key)
+        super().__setitem__(key, obj)
+        self.buckets.setdefault(key.split(".")[0], {})[key] = obj
+        self.__link(key, obj)
+
+    def __delitem__(self, key):
+        """
+        removes key from the index, its class bucket and its reverse indexes
+        """
+        super().__delitem__(key)
+        del self.buckets[key.split(".")[0]][key]
+        self.__unlink(key)
+        self.__unsort(key)
+
+    def __link(self, key, obj):
+        """
+        adds obj to the reverse index of each foreign key it holds
+        """
+        name = key.split(".")[0]
+        linked = []
+        for attr in foreign_keys:
+            value = getattr(obj, attr, None)
+            if value:
+                link = (name, attr, value)
+                self.links.setdefault(link, {})[key] = obj
+                linked.append(link)
+                if link in self.__sorted_links:
+                    bisect.insort(self.__sorted_links[link], key)
+        if linked:
+            self.__linked[key] = linked
+
+    def __unlink(self, key):
+        """
+        removes key from every reverse index it was added to
+        """
+        for link in self.__linked.pop(key, ()):
+            del self.links[link][key]
+            keys = self.__sorted_links.get(link)
+            if keys is not None:
+                del keys[bisect.bisect_left(keys, key)]
+            if not self.links[link]:
+                del self.links[link]
+                self.__sorted_links.pop(link, None)
+
+    def __unsort(self, key):
+        """
+        removes key from the sorted keys of its class
+        """
+        keys = self.__sorted.get(key.split(".")[0])
+        if keys is not None:
+            del keys[bisect.bisect_left(keys, key)]
+
+    def sorted_keys(self, name):
+        """
+        returns the keys of class name in order, sorting them the first
+        time only; callers must not change the list
+        """
+        keys = self.__sorted.get(name)
+        if keys is None:
+            keys = sorted(self.buckets.get(name, ()))
+            self.__sorted[name] = keys
+        return keys
+
+    def sorted_link_keys(self, link):
+        """
+        returns the keys of the reverse index link in order, sorting
+        them the first time only; callers must not change the list
+        """
+        keys = self.__sorted_links.get(link)
+        if keys is None:
+            keys = sorted(self.links.get(link, ()))
+            if keys:
+                self.__sorted_links[link] = keys
+        return keys
+
+    def relink(self, key):
+        """
+        re-indexes the object under key after its foreign keys changed
+        """
+        if key in self:
+            self.__unlink(key)
+            self.__link(key, self[key])
+
+    def pop(self, key, *default):
+        """
+        removes key and returns its object
+        """
+        if key in self:
+            obj = self[key]
+            del self[key]
+            return obj
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self):
+        """
+        removes and returns the last inserted (key, object) pair
+        """
+        key, obj = super().popitem()
+        del self.buckets[key.split(".")[0]][key]
+        self.__unlink(key)
+        self.__unsort(key)
+        return key, obj
+
+    def setdefault(self, key, default=None):
+        """
+        stores default under key if key is missing and returns its object
+        """
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        """
+        stores every (key, object) pair given
+        """
+        for key, obj in dict(*args, **kwargs).items():
+            self[key] = obj
+
+    def clear(self):
+        """
+        empties the index, every class bucket and every reverse index
+        """
+        super().clear()
+        self.buckets.clear()
+        self.links.clear()
+        self.__linked.clear()
+        self.__sorted.clear()
+        self.__sorted_links.clear()
+
 
 class FileStorage:
     """
-    serializes/deserializes instances to/from a JSON file
+    serializes/deserializes instances to/from a JSON file, or to one
+    JSON file per class (shard) in the sharded layout; many threads may
+    read at once while changes to __objects run alone, and one thread
+    at a time writes files, which with HBNB_FILE_SHARED set is also
+    coordinated with other processes through a file lock and a
+    generation counter
     """
     __file_path = "file.json"
-    __objects = {}
+    __journal_path = __file_path + ".log"
+    __shards_path = __file_path + ".d"
+    __generation_path = __file_path + ".gen"
+    __journal = os.getenv("HBNB_FILE_JOURNAL") == "1"
+    __journal_max = int(os.getenv("HBNB_FILE_JOURNAL_MAX", 10000))
+    __journal_records = 0
+    __workers = int(os.getenv("HBNB_RELOAD_WORKERS", 1))
+    __serializer = formats[os.getenv("HBNB_FILE_FORMAT", "json")]
+    __sharded = os.getenv("HBNB_FILE_LAYOUT") == "sharded"
+    __shard_count = int(os.getenv("HBNB_FILE_SHARDS", 1))
+    __group_commit = os.getenv("HBNB_FILE_GROUP_COMMIT") == "1"
+    __flush_ms = int(os.getenv("HBNB_FILE_FLUSH_MS", 0))
+    __shared = os.getenv("HBNB_FILE_SHARED") == "1"
+    __wanted = [name for name in os.getenv("HBNB_STORAGE_CLASSES",
+                                           "").split(",") if name]
+    __loaded = set()
+    __objects = ObjectIndex()
+    __pending = set()
+    __dirty_shards = set()
+    __fragments = {}
+    __seen = None
+    __generation = 0
+    __lock = ReadWriteLock()
+    __file_lock = FileLock(__file_path + ".lock" if __shared else None)
+    __saving = threading.RLock()
+    __group = threading.Condition()
+    __requested = 0
+    __flushed = 0
+    __flushing = False
+    __behind = threading.Condition()
+    __flusher = None
+    __stopping = False
+    __marked = 0
+    __written = 0
 
-    def all(self, cls=None):
+    def all(self, cls=None, load=None):
         """
-        returns the dictionary __objects
+        returns a copy of the dictionary __objects; load is ignored, as
+        relationships are read from the reverse indexes when used
         """
         if cls is not None:
-            new_dict = {}
-            for key, value in self.__objects.items():
-                if cls == value.__class__ or cls == value.__class__.__name__:
-                    new_dict[key] = value
-            return new_dict
-        return self.__objects
+            if not isinstance(cls, str):
+                cls = cls.__name__
+            self.__ensure(cls)
+            with self.__lock.read():
+                return dict(self.__objects.buckets.get(cls, {}))
+        self.__ensure(*classes)
+        with self.__lock.read():
+            return dict(self.__objects)
 
     def new(self, obj):
         """
         creates a new object in __objects
         """
         if obj is not None:
+            self.__ensure(obj.__class__.__name__)
             key = obj.__class__.__name__ + "." + obj.id
-            self.__objects[key] = obj
+            with self.__lock.write():
+                self.__objects[key] = obj
+                self.__mark(key)
+
+    def __mark(self, key):
+        """
+        marks the object under key, and its shard, for the next save
+        """
+        self.__pending.add(key)
+        if self.__sharded:
+            self.__dirty_shards.add(self.__shard(key))
+
+    def __shard(self, key):
+        """
+        returns the name of the shard holding key: its class name,
+        followed by a hash of its id when classes are split further
+        """
+        name, _, id = key.partition(".")
+        if self.__shard_count > 1:
+            return "{}.{}".format(name,
+                                  zlib.crc32(id.encode()) % self.__shard_count)
+        return name
+
+    def __ensure(self, *names):
+        """
+        loads the shards of the classes in names that were not loaded yet
+        """
+        if self.__sharded:
+            if any(name not in self.__loaded for name in names):
+                with self.__file_lock.shared(), self.__lock.write():
+                    missing = [name for name in names
+                               if name not in self.__loaded]
+                    if missing:
+                        self.__load_shards(missing)
 
     def save(self):
         """
-        serializes __objects to JSON file
+        serializes __objects to JSON file, or in journal mode appends
+        the objects changed since the last save to the journal; with
+        HBNB_FILE_FLUSH_MS set, only wakes the background flusher
         """
-        json_objects = {}
-        for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict()
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
+        if self.__flush_ms > 0:
+            with self.__behind:
+                if self.__flusher is None:
+                    FileStorage.__flusher = threading.Thread(
+                        target=self.__flush_behind, daemon=True)
+                    self.__flusher.start()
+                    atexit.register(self.__finish)
+                FileStorage.__marked += 1
+                self.__behind.notify_all()
+            return
+        self.flush()
+
+    def flush(self):
+        """
+        writes the changes of every save so far; in group commit mode,
+        flushes called while a write runs are all served by the next
+        durable write
+        """
+        if not self.__group_commit:
+            self.__flush()
+            return
+        with self.__group:
+            FileStorage.__requested += 1
+            ticket = self.__requested
+            while self.__flushed < ticket:
+                if self.__flushing:
+                    self.__group.wait()
+                    continue
+                FileStorage.__flushing = True
+                target = self.__requested
+                self.__group.release()
+                try:
+                    self.__flush()
+                    FileStorage.__flushed = target
+                finally:
+                    self.__group.acquire()
+                    FileStorage.__flushing = False
+                    self.__group.notify_all()
+
+    def __flush_behind(self):
+        """
+        runs in the flusher thread: writes the changes of the saves
+        marked at most HBNB_FILE_FLUSH_MS milliseconds ago, until stopped;
+        a failed write is logged and tried again after the interval
+        """
+        while True:
+            with self.__behind:
+                while self.__marked == self.__written and not self.__stopping:
+                    self.__behind.wait()
+                if self.__marked == self.__written:
+                    return
+                self.__behind.wait_for(lambda: self.__stopping,
+                                       self.__flush_ms / 1000)
+                target = self.__marked
+            try:
+                self.flush()
+            except Exception:
+                if self.__stopping:
+                    raise
+                logging.getLogger(__name__).exception(
+                    "write-behind flush failed, retrying")
+                continue
+            with self.__behind:
+                FileStorage.__written = target
+                self.__behind.notify_all()
+
+    def __finish(self):
+        """
+        writes the changes still waiting for the flusher and stops it,
+        at process exit
+        """
+        with self.__behind:
+            flusher = self.__flusher
+            FileStorage.__stopping = True
+            self.__behind.notify_all()
+        if flusher is not None:
+            flusher.join()
+        with self.__behind:
+            FileStorage.__flusher = None
+            FileStorage.__stopping = False
+
+    def __flush(self):
+        """
+        writes the changes of flush, syncing them to disk in group commit
+        mode
+        """
+        with self.__saving, self.__file_lock.exclusive():
+            self.__catch_up()
+            records = FileStorage.__journal_records + len(self.__pending)
+            if not self.__journal or records > self.__journal_max:
+                self.compact()
+                return
+            with self.__lock.read(), open(self.__journal_path, 'a') as f:
+                for key in self.__pending:
+                    if self.__serializer is formats["json"]:
+                        text = self.__encode(key)
+                    else:
+                        obj = self.__objects.get(key)
+                        text = obj and json.dumps(obj.to_dict())
+                    f.write("[" + json.dumps(key) + ", " + (text or "null") +
+                            "]\n")
+                if self.__group_commit:
+                    f.flush()
+                    os.fsync(f.fileno())
+                FileStorage.__journal_records = records
+                self.__pending.clear()
+            self.__wrote()
+
+    def compact(self):
+        """
+        writes a fresh JSON file of __objects, or the shards changed
+        since they were last written, and empties the journal
+        """
+        with self.__saving, self.__file_lock.exclusive():
+            self.__catch_up()
+            if self.__sharded and os.path.exists(self.__journal_path):
+                self.__ensure(*classes)
+            with self.__lock.read():
+                self.__compact()
+            self.__wrote()
+
+    def __wrote(self):
+        """
+        records the files this process just wrote as seen and, with
+        HBNB_FILE_SHARED set, tells the other processes by bumping the
+        generation
+        """
+        if self.__shared:
+            generation = self.__read_generation() + 1
+            tmp_path = self.__generation_path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(str(generation))
+            os.replace(tmp_path, self.__generation_path)
+            FileStorage.__generation = generation
+        FileStorage.__seen = self.__signature()
+
+    def __read_generation(self):
+        """
+        returns the generation written by the last process to save, 0
+        before the first save and -1 if it can't be read
+        """
+        try:
+            with open(self.__generation_path) as f:
+                return int(f.read())
+        except FileNotFoundError:
+            return 0
+        except ValueError:
+            return -1
+
+    def __catch_up(self):
+        """
+        with HBNB_FILE_SHARED set, applies the changes other processes
+        saved since this one last read or wrote the files, keeping the
+        changes of this process not saved yet; only the new journal
+        records are read while no other process compacted the files
+        """
+        if not self.__shared:
+            return
+        seen = self.__seen
+        signature = self.__signature()
+        if (self.__read_generation() == self.__generation and
+                signature == seen):
+            return
+        with self.__lock.write():
+            keep = {key: self.__objects.get(key) for key in self.__pending}
+            start = seen[1][1] if seen and seen[1] else 0
+            if (seen and signature[0::2] == seen[0::2] and signature[1] and
+                    (not seen[1] or signature[1][0] == seen[1][0]) and
+                    signature[1][1] >= start):
+                self.__replay_journal(
+                    self.__loaded if self.__sharded else None, start)
+            else:
+                self.__objects.clear()
+                if self.__sharded:
+                    names = set(self.__loaded)
+                    self.__loaded.clear()
+                    self.__load_shards(names)
+                else:
+                    self.__load_file(self.__file_path)
+                    self.__replay_journal()
+            for key, obj in keep.items():
+                if obj is None:
+                    self.__objects.pop(key, None)
+                else:
+                    self.__objects[key] = obj
+                self.__mark(key)
+        FileStorage.__generation = self.__read_generation()
+        FileStorage.__seen = self.__signature()
+
+    def __compact(self):
+        """
+        writes the files of compact while the caller holds the locks
+        """
+        if self.__sharded:
+            shards = {shard: [] for shard in self.__dirty_shards}
+            for name in {shard.split(".")[0] for shard in shards}:
+                for key in self.__objects.buckets.get(name, {}):
+                    shard = self.__shard(key)
+                    if shard in shards:
+                        shards[shard].append(key)
+            os.makedirs(self.__shards_path, exist_ok=True)
+            for shard, keys in shards.items():
+                path = os.path.join(self.__shards_path, shard + ".json")
+                if keys:
+                    self.__write(path, keys)
+                elif os.path.exists(path):
+                    os.remove(path)
+            self.__dirty_shards.clear()
+        else:
+            self.__write(self.__file_path, self.__objects)
+        if len(self.__fragments) > len(self.__objects):
+            FileStorage.__fragments = {key: self.__fragments[key]
+                                       for key in self.__objects
+                                       if key in self.__fragments}
+        if os.path.exists(self.__journal_path):
+            os.remove(self.__journal_path)
+        FileStorage.__journal_records = 0
+        self.__pending.clear()
+
+    def __write(self, path, keys):
+        """
+        atomically writes the objects under keys to the file at path
+        with the HBNB_FILE_FORMAT serializer, re-encoding only the
+        objects changed since they were last encoded
+        """
+        fragments = []
+        for key in keys:
+            obj = self.__objects[key]
+            cached = self.__fragments.get(key)
+            if key in self.__pending or cached is None or cached[0] is not obj:
+                fragments.append((key, self.__encode(key)))
+            else:
+                fragments.append((key, cached[1]))
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w' + self.__serializer.mode) as f:
+            self.__serializer.write(f, fragments)
+            if self.__group_commit:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def __encode(self, key):
+        """
+        encodes the object under key with the HBNB_FILE_FORMAT serializer
+        and caches the result, returns None if no object is under key
+        """
+        obj = self.__objects.get(key)
+        if obj is None:
+            self.__fragments.pop(key, None)
+            return None
+        data = self.__serializer.encode(obj)
+        self.__fragments[key] = (obj, data)
+        return data
+
+    def convert(self, name):
+        """
+        rewrites every stored object with the serializer called name
+        """
+        self.__ensure(*classes)
+        with self.__saving:
+            with self.__lock.write():
+                FileStorage.__serializer = formats[name]
+                self.__fragments.clear()
+                for key in self.__objects:
+                    self.__mark(key)
+            self.compact()
 
     def reload(self):
         """
-        deserializes the JSON file to __objects
+        deserializes the JSON file to __objects one object at a time,
+        or across HBNB_RELOAD_WORKERS processes, and replays the journal;
+        in the sharded layout only the shards of HBNB_STORAGE_CLASSES
+        (every class if unset) and of classes already loaded are read
+        """
+        with self.__saving, self.__file_lock.shared(), self.__lock.write():
+            if self.__sharded:
+                names = self.__loaded.union(self.__wanted or classes)
+                self.__loaded.clear()
+                self.__load_shards(names)
+            else:
+                self.__load_file(self.__file_path)
+                self.__replay_journal()
+            FileStorage.__generation = self.__read_generation()
+            FileStorage.__seen = self.__signature()
+
+    def __load_shards(self, names):
+        """
+        loads the shards of the classes in names and replays their
+        journal records; a shard written under another HBNB_FILE_SHARDS
+        is loaded first, so that the shards of the current count win,
+        and it is rewritten, or removed, with the shards of its objects
+        at the next compaction
+        """
+        try:
+            files = sorted(os.listdir(self.__shards_path))
+        except FileNotFoundError:
+            files = []
+        current = []
+        for file in files:
+            if file.endswith(".json") and file.split(".")[0] in names:
+                shard = file[:-len(".json")]
+                pairs = list(self.__read_file(
+                    os.path.join(self.__shards_path, file)))
+                if all(self.__shard(key) == shard for key, obj in pairs):
+                    current.append(pairs)
+                    continue
+                self.__dirty_shards.add(shard)
+                for key, obj in pairs:
+                    self.__objects[key] = obj
+                    self.__dirty_shards.add(self.__shard(key))
+        for pairs in current:
+            self.__objects.update(pairs)
+        self.__loaded.update(names)
+        self.__replay_journal(names)
+
+    def __load_file(self, path):
+        """
+        loads the objects of the JSON or binary file at path into __objects
+        """
+        for key, obj in self.__read_file(path):
+            self.__objects[key] = obj
+
+    def __read_file(self, path):
+        """
+        yields the (key, object) pairs of the JSON or binary file at path,
+        none if it is missing
+        """
+        try:
+            with open(path, 'rb') as f:
+                binary = formats["binary"].sniff(f.peek(1)[:1])
+        except FileNotFoundError:
+            return
+        if binary:
+            with open(path, 'rb') as f:
+                yield from hydrate(formats["binary"].iter_items(f))
+        else:
+            with open(path, 'r') as f:
+                pairs = self.__reload_parallel(f)
+                if pairs is None:
+                    f.seek(0)
+                    pairs = hydrate(iter_items(f))
+                yield from pairs
+
+    def __signature(self):
+        """
+        returns the inode, size and modification time of the JSON file,
+        the journal and the shards directory, None for a missing one
+        """
+        signature = []
+        for path in (self.__file_path, self.__journal_path,
+                     self.__shards_path):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def __reload_parallel(self, f):
+        """
+        splits a one-object-per-line JSON file into chunks and decodes
+        them across __workers processes, returns their (key, object)
+        pairs, or None if the file has another layout or workers are
+        disabled
         """
+        if (self.__workers < 2 or f.readline() != "{\n" or
+                "fork" not in multiprocessing.get_all_start_methods()):
+            return None
+        lines = []
+        for line in f:
+            if line.startswith('"'):
+                lines.append(line)
+            elif line.strip() not in ("", "}"):
+                return None
+        size = -(-len(lines) // (self.__workers * 4)) or 1
+        chunks = [lines[i:i + size] for i in range(0, len(lines), size)]
+        context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(self.__workers, mp_context=context) as pool:
+            return itertools.chain.from_iterable(pool.map(load_chunk,
+                                                          chunks))
+
+    def __replay_journal(self, names=None, start=0):
+        """
+        applies the journal records of the classes in names (all if None)
+        from byte start on to __objects, dropping a torn last record left
+        by an interrupted append
+        """
+        records = self.__journal_records if start else 0
+        offset = start
         try:
-            with open(self.__file_path, 'r') as f:
-                jo = json.load(f)
-            for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
+            with open(self.__journal_path, 'rb') as f:
+                f.seek(start)
+                for line in f:
+                    try:
+                        key, value = json.loads(line)
+                    except ValueError:
+                        break
+                    if not line.endswith(b"\n"):
+                        break
+                    records += 1
+                    offset += len(line)
+                    if names is not None and key.split(".")[0] not in names:
+                        continue
+                    if value is None:
+                        self.__objects.pop(key, None)
+                    else:
+                        self.__objects[key], = \
+                            classes[value["__class__"]].from_dicts((value,))
+                    if self.__sharded:
+                        self.__dirty_shards.add(self.__shard(key))
+                torn = f.seek(0, os.SEEK_END) > offset
+            if torn:
+                with open(self.__journal_path, 'r+b') as f:
+                    f.truncate(offset)
         except FileNotFoundError:
             pass
+        FileStorage.__journal_records = records
 
     def delete(self, obj=None):
         """
@@ -77,29 +757,91 @@ class FileStorage:
         """
         if obj is not None:
             key = obj.__class__.__name__ + '.' + obj.id
-            if key in self.__objects:
-                del self.__objects[key]
+            with self.__lock.write():
+                if key in self.__objects:
+                    del self.__objects[key]
+                    self.__mark(key)
 
-    def get(self, cls, id):
+    def get(self, cls, id, load=None):
         """
-        retrieves an object from __objects by class and id
+        retrieves an object from __objects by class and id; load is
+        ignored, as in 'all'
         """
         if cls and id:
+            self.__ensure(cls.__name__)
             key = f"{cls.__name__}.{id}"
-            return self.__objects.get(key)
+            with self.__lock.read():
+                return self.__objects.get(key)
         return None
 
+    def related(self, cls, attr, value):
+        """
+        returns the list of cls objects whose foreign key attr is value
+        """
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        self.__ensure(cls)
+        with self.__lock.read():
+            linked = self.__objects.links.get((cls, attr, value), {})
+            return list(linked.values())
+
+    def page(self, cls, limit, after=None, attr=None, value=None):
+        """
+        returns, in id order, at most limit cls objects whose id comes
+        after the id after, only those whose foreign key attr is value
+        if attr is given
+        """
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        self.__ensure(cls)
+        with self.__lock.read():
+            if attr is None:
+                keys = self.__objects.sorted_keys(cls)
+            else:
+                keys = self.__objects.sorted_link_keys((cls, attr, value))
+            start = 0
+            if after is not None:
+                start = bisect.bisect_right(keys, cls + "." + after)
+            return [self.__objects[key] for key in keys[start:start + limit]]
+
+    def touch(self, obj, name):
+        """
+        keeps the indexes in step after attribute name of obj changed
+        and marks obj for the next save
+        """
+        key = "{}.{}".format(obj.__class__.__name__, getattr(obj, "id", None))
+        if self.__objects.get(key) is obj:
+            with self.__lock.write():
+                if self.__objects.get(key) is obj:
+                    if name in foreign_keys:
+                        self.__objects.relink(key)
+                    self.__mark(key)
+
     def count(self, cls=None):
         """
         counts the number of objects in storage
         """
         if cls:
-            return sum(1 for obj in self.__objects.values()
-                       if isinstance(obj, cls))
+            self.__ensure(*[name for name, value in classes.items()
+                            if issubclass(value, cls)])
+            with self.__lock.read():
+                return sum(len(bucket)
+                           for name, bucket in self.__objects.buckets.items()
+                           if issubclass(classes.get(name, object), cls))
+        self.__ensure(*classes)
         return len(self.__objects)
 
     def close(self):
         """
-        closes the session and calls reload
+        calls reload if the JSON file, the journal or the shards changed
+        on disk since this process last read or wrote them, unless saves
+        are still waiting for the flusher
         """
-        self.reload()
+        with self.__saving:
+            if self.__marked != self.__written:
+                return
+            if self.__shared:
+                with self.__file_lock.shared():
+                    self.__catch_up()
+            elif self.__signature() != self.__seen:
+                self.reload()
@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+"""
+Contains the locks shared by the storage engines
+"""
+
+from contextlib import contextmanager
+import os
+import threading
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class ReadWriteLock:
+    """
+    lets many threads read at once while writes run alone; waiting
+    writers hold back new readers, and both sides may re-enter
+    """
+
+    def __init__(self):
+        """
+        initializes an unlocked lock
+        """
+        self.__cond = threading.Condition(threading.Lock())
+        self.__readers = 0
+        self.__writer = None
+        self.__depth = 0
+        self.__waiting = 0
+        self.__local = threading.local()
+
+    def acquire_read(self):
+        """
+        blocks until no writer holds or waits for the lock, then
+        registers the calling thread as a reader
+        """
+        local = self.__local
+        if self.__writer == threading.get_ident():
+            local.nested = getattr(local, "nested", 0) + 1
+            return
+        reads = getattr(local, "reads", 0)
+        if not reads:
+            with self.__cond:
+                while self.__writer is not None or self.__waiting:
+                    self.__cond.wait()
+                self.__readers += 1
+        local.reads = reads + 1
+
+    def release_read(self):
+        """
+        releases one read of the calling thread
+        """
+        local = self.__local
+        if getattr(local, "nested", 0):
+            local.nested -= 1
+            return
+        local.reads -= 1
+        if not local.reads:
+            with self.__cond:
+                self.__readers -= 1
+                if not self.__readers:
+                    self.__cond.notify_all()
+
+    def acquire_write(self):
+        """
+        blocks until the calling thread is the only holder of the lock
+        """
+        me = threading.get_ident()
+        if self.__writer == me:
+            self.__depth += 1
+            return
+        if getattr(self.__local, "reads", 0):
+            raise RuntimeError("cannot upgrade a read lock to a write lock")
+        with self.__cond:
+            self.__waiting += 1
+            while self.__writer is not None or self.__readers:
+                self.__cond.wait()
+            self.__waiting -= 1
+            self.__writer = me
+            self.__depth = 1
+
+    def release_write(self):
+        """
+        releases one write of the calling thread
+        """
+        self.__depth -= 1
+        if not self.__depth:
+            with self.__cond:
+                self.__writer = None
+                self.__cond.notify_all()
+
+    @contextmanager
+    def read(self):
+        """
+        holds the lock for reading inside a with block
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """
+        holds the lock for writing inside a with block
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class FileLock:
+    """
+    advisory lock on a file shared by every process using it, shared
+    for reading or exclusive for writing; a thread may re-enter it, and
+    it does nothing without a path or where fcntl is missing
+    """
+
+    def __init__(self, path=None):
+        """
+        initializes the lock on the file at path
+        """
+        self.__path = path
+        self.__local = threading.local()
+
+    @contextmanager
+    def __hold(self, exclusive):
+        """
+        holds the lock inside a with block, reusing the hold of the
+        calling thread if it already has one
+        """
+        local = self.__local
+        if self.__path is None or fcntl is None:
+            yield
+            return
+        if getattr(local, "depth", 0):
+            if exclusive and not local.exclusive:
+                raise RuntimeError("cannot upgrade a shared file lock")
+            local.depth += 1
+            try:
+                yield
+            finally:
+                local.depth -= 1
+            return
+        fd = os.open(self.__path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            local.depth = 1
+            local.exclusive = exclusive
+            try:
+                yield
+            finally:
+                local.depth = 0
+        finally:
+            os.close(fd)
+
+    def shared(self):
+        """
+        holds the lock for reading inside a with block
+        """
+        return self.__hold(False)
+
+    def exclusive(self):
+        """
+        holds the lock for writing inside a with block
+        """
+        return self.__hold(True)
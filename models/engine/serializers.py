@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+"""
+Contains the serializers FileStorage uses to write and read its files
+"""
+
+from datetime import datetime, timedelta
+import json
+from json.decoder import WHITESPACE
+import pickle
+
+epoch = datetime(1970, 1, 1)
+microsecond = timedelta(microseconds=1)
+
+
+def iter_items(f, chunk_size=1 << 16):
+    """
+    yields the (key, value) pairs of the JSON object in file f one at a
+    time, reading f in chunks so only one value is decoded at once
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    state = "start"
+    while True:
+        pos = WHITESPACE.match(buf, pos).end()
+        if pos < len(buf):
+            char = buf[pos]
+            if state == "start":
+                if char != "{":
+                    raise ValueError("JSON file is not an object")
+                pos += 1
+                state = "first"
+                continue
+            if state in ("first", "next") and char == "}":
+                return
+            if state == "colon" or state == "next":
+                if char != (":" if state == "colon" else ","):
+                    raise ValueError("malformed JSON file")
+                pos += 1
+                state = "value" if state == "colon" else "key"
+                continue
+            try:
+                item, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if state == "value":
+                    yield key, item
+                    state = "next"
+                else:
+                    key = item
+                    state = "colon"
+                continue
+        chunk = f.read(chunk_size)
+        if not chunk:
+            raise ValueError("unexpected end of JSON file")
+        buf = buf[pos:] + chunk
+        pos = 0
+
+
+class JSONSerializer:
+    """
+    writes and reads a JSON object of <class name>.<id> keys, one
+    object per line
+    """
+    name = "json"
+    mode = ""
+
+    def encode(self, obj):
+        """
+        returns the JSON text of obj
+        """
+        return json.dumps(obj.to_dict())
+
+    def write(self, f, fragments):
+        """
+        writes the (key, JSON text) pairs of fragments to file f
+        """
+        lines = (json.dumps(key) + ": " + text for key, text in fragments)
+        f.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+    def iter_items(self, f):
+        """
+        yields the (key, dictionary) pairs of file f one at a time
+        """
+        return iter_items(f)
+
+
+class Unpickler(pickle.Unpickler):
+    """
+    unpickler that refuses to load anything but plain values
+    """
+
+    def find_class(self, module, name):
+        """
+        rejects every global so a file cannot run code when read
+        """
+        raise pickle.UnpicklingError("{}.{} is not allowed in a storage "
+                                     "file".format(module, name))
+
+
+class BinarySerializer:
+    """
+    writes and reads a header holding the class names followed by one
+    pickle per object of (class index, attributes), with created_at and
+    updated_at as integer microseconds since the epoch
+    """
+    name = "binary"
+    mode = "b"
+    magic = "HBNB"
+    version = 1
+
+    def __init__(self, classes):
+        """
+        interns the names of classes as their index in the header
+        """
+        self.names = tuple(classes)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def sniff(self, head):
+        """
+        tells whether a file starting with bytes head is in this format
+        """
+        return head == b"\x80"
+
+    def encode(self, obj):
+        """
+        returns the binary record of obj
+        """
+        fields = obj.__dict__.copy()
+        fields.pop("_sa_instance_state", None)
+        for attr in ("created_at", "updated_at"):
+            if isinstance(fields.get(attr), datetime):
+                fields[attr] = (fields[attr] - epoch) // microsecond
+        return pickle.dumps((self.index[obj.__class__.__name__], fields), 5)
+
+    def write(self, f, fragments):
+        """
+        writes the header then the records of the (key, record) pairs
+        of fragments to file f
+        """
+        f.write(pickle.dumps((self.magic, self.version, self.names), 5))
+        for key, data in fragments:
+            f.write(data)
+
+    def iter_items(self, f):
+        """
+        yields the (key, dictionary) pairs of file f one at a time
+        """
+        unpickler = Unpickler(f)
+        magic, version, names = unpickler.load()
+        if magic != self.magic or version != self.version:
+            raise ValueError("unknown binary storage file version")
+        while True:
+            try:
+                index, fields = unpickler.load()
+            except EOFError:
+                return
+            for attr in ("created_at", "updated_at"):
+                if isinstance(fields.get(attr), int):
+                    fields[attr] = epoch + fields[attr] * microsecond
+            fields["__class__"] = names[index]
+            yield names[index] + "." + fields["id"], fields
@@ -0,0 +1,237 @@
+#!/usr/bin/python3
+"""
+Contains the class SQLiteStorage
+"""
+
+import json
+from models.amenity import Amenity
+from models.base_model import BaseModel
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+from os import getenv
+import sqlite3
+import threading
+import weakref
+
+classes = {"Amenity": Amenity,
+           "BaseModel": BaseModel,
+           "City": City,
+           "Place": Place,
+           "Review": Review,
+           "State": State,
+           "User": User
+           }
+
+columns = {"City": ("state_id",),
+           "Place": ("city_id", "user_id"),
+           "Review": ("place_id", "user_id")
+           }
+
+
+class SQLiteStorage:
+    """
+    manages storage of hbnb models in an embedded SQLite database, one
+    table per class with an indexed column per foreign key
+    """
+
+    def __init__(self):
+        """
+        sets the database path and the per-thread session state
+        """
+        self.__path = getenv("HBNB_SQLITE_DB", "hbnb.db")
+        self.__local = threading.local()
+
+    def __session(self):
+        """
+        returns the connection, pending changes and identity map of the
+        current thread, opening the connection on first use
+        """
+        local = self.__local
+        if getattr(local, "conn", None) is None:
+            local.conn = sqlite3.connect(self.__path, timeout=30)
+            local.pending = {}
+            local.identity = weakref.WeakValueDictionary()
+        return local
+
+    def __flush(self):
+        """
+        writes the pending changes of the current thread into its open
+        transaction
+        """
+        local = self.__session()
+        for key, obj in local.pending.items():
+            name, id = key.split(".", 1)
+            if obj is None:
+                local.conn.execute('DELETE FROM "{}" WHERE id = ?'.format(
+                    name), (id,))
+                continue
+            fks = columns.get(name, ())
+            values = [id] + [getattr(obj, fk, None) for fk in fks]
+            values.append(json.dumps(obj.to_dict()))
+            local.conn.execute(
+                'INSERT OR REPLACE INTO "{}" (id, {}data) VALUES ({}?)'.format(
+                    name, "".join(fk + ", " for fk in fks),
+                    "?, " * (len(fks) + 1)), values)
+            local.identity[key] = obj
+        local.pending.clear()
+        return local
+
+    def __hydrate(self, local, name, rows):
+        """
+        returns a dictionary of the objects for rows of (id, data),
+        reusing the instances this thread already holds
+        """
+        new_dict = {}
+        for id, data in rows:
+            key = name + "." + id
+            obj = local.identity.get(key)
+            if obj is None:
+                obj = classes[name](**json.loads(data))
+                local.identity[key] = obj
+            new_dict[key] = obj
+        return new_dict
+
+    def all(self, cls=None, load=None):
+        """
+        returns a dictionary of all objects in the database; load is
+        ignored, as relationships are read by indexed foreign key
+        """
+        if cls is None:
+            new_dict = {}
+            for name in classes:
+                new_dict.update(self.all(name))
+            return new_dict
+        name = cls if isinstance(cls, str) else cls.__name__
+        if name not in classes:
+            return {}
+        local = self.__flush()
+        rows = local.conn.execute('SELECT id, data FROM "{}"'.format(name))
+        return self.__hydrate(local, name, rows)
+
+    def new(self, obj):
+        """
+        adds obj to the changes written by the next save
+        """
+        if obj is not None:
+            key = obj.__class__.__name__ + "." + obj.id
+            self.__session().pending[key] = obj
+
+    def save(self):
+        """
+        commits all changes of the current thread
+        """
+        self.__flush().conn.commit()
+
+    def delete(self, obj=None):
+        """
+        deletes obj at the next save
+        """
+        if obj is not None:
+            key = obj.__class__.__name__ + "." + obj.id
+            local = self.__session()
+            local.pending[key] = None
+            local.identity.pop(key, None)
+
+    def reload(self):
+        """
+        creates the tables and the (foreign key, id) indexes and switches
+        the database to write-ahead logging
+        """
+        local = self.__session()
+        local.conn.execute("PRAGMA journal_mode = WAL")
+        for name in classes:
+            fks = columns.get(name, ())
+            local.conn.execute(
+                'CREATE TABLE IF NOT EXISTS "{}" (id TEXT PRIMARY KEY, {}'
+                'data TEXT NOT NULL)'.format(
+                    name, "".join(fk + " TEXT, " for fk in fks)))
+            for fk in fks:
+                local.conn.execute(
+                    'CREATE INDEX IF NOT EXISTS "{0}_{1}_id" ON "{0}" '
+                    '({1}, id)'.format(name, fk))
+        local.conn.commit()
+
+    def get(self, cls, id, load=None):
+        """
+        retrieves one object based on class and ID; load is ignored, as
+        in 'all'
+        """
+        if cls not in classes.values() or id is None:
+            return None
+        local = self.__flush()
+        key = cls.__name__ + "." + id
+        if key in local.identity:
+            return local.identity[key]
+        rows = local.conn.execute('SELECT id, data FROM "{}" WHERE id = ?'
+                                  .format(cls.__name__), (id,))
+        return self.__hydrate(local, cls.__name__, rows).get(key)
+
+    def related(self, cls, attr, value):
+        """
+        returns the list of cls objects whose foreign key attr is value
+        """
+        name = cls if isinstance(cls, str) else cls.__name__
+        if attr not in columns.get(name, ()):
+            return []
+        local = self.__flush()
+        rows = local.conn.execute('SELECT id, data FROM "{}" WHERE {} = ?'
+                                  .format(name, attr), (value,))
+        return list(self.__hydrate(local, name, rows).values())
+
+    def page(self, cls, limit, after=None, attr=None, value=None):
+        """
+        returns, in id order, at most limit cls objects whose id comes
+        after the id after, only those whose foreign key attr is value
+        if attr is given
+        """
+        name = cls if isinstance(cls, str) else cls.__name__
+        if name not in classes or (attr is not None and
+                                   attr not in columns.get(name, ())):
+            return []
+        where, args = ["id > ?"], [after or ""]
+        if attr is not None:
+            where.append(attr + " = ?")
+            args.append(value)
+        local = self.__flush()
+        rows = local.conn.execute(
+            'SELECT id, data FROM "{}" WHERE {} ORDER BY id LIMIT ?'.format(
+                name, " AND ".join(where)), args + [limit])
+        return list(self.__hydrate(local, name, rows).values())
+
+    def touch(self, obj, name):
+        """
+        marks obj for the next save after attribute name changed, if this
+        thread loaded it
+        """
+        local = self.__local
+        if getattr(local, "conn", None) is None:
+            return
+        key = "{}.{}".format(obj.__class__.__name__, getattr(obj, "id", None))
+        if local.identity.get(key) is obj:
+            local.pending[key] = obj
+
+    def count(self, cls=None):
+        """
+        counts the number of objects in storage of a certain class
+        """
+        if cls is None:
+            return sum(self.count(cls) for cls in classes.values())
+        if cls in classes.values():
+            local = self.__flush()
+            return local.conn.execute('SELECT COUNT(*) FROM "{}"'.format(
+                cls.__name__)).fetchone()[0]
+        return 0
+
+    def close(self):
+        """
+        rolls back uncommitted changes and closes the connection of the
+        current thread
+        """
+        local = self.__local
+        if getattr(local, "conn", None) is not None:
+            local.conn.rollback()
+            local.conn.close()
+            local.conn = None
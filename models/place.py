@@ -67,12 +67,7 @@ class Place(BaseModel, Base):
             getter attribute - returns a list of Review instances
             """
             from models.review import Review
-            review_list = []
-            all_reviews = models.storage.all(Review)
-            for review in all_reviews.values():
-                if review.place_id == self.id:
-                    review_list.append(review)
-            return review_list
+            return models.storage.related(Review, "place_id", self.id)
 
         @property
         def amenities(self):
@@ -81,8 +76,8 @@ class Place(BaseModel, Base):
             """
             from models.amenity import Amenity
             amenity_list = []
-            all_amenities = models.storage.all(Amenity)
-            for amenity in all_amenities.values():
-                if amenity.place_id == self.id:
+            for amenity_id in self.amenity_ids:
+                amenity = models.storage.get(Amenity, amenity_id)
+                if amenity is not None:
                     amenity_list.append(amenity)
             return amenity_list
@@ -34,9 +34,4 @@ class State(BaseModel, Base):
             """
             getter attribute - returns list of City instances
             """
-            city_list = []
-            all_cities = models.storage.all(City)
-            for city in all_cities.values():
-                if city.state_id == self.id:
-                    city_list.append(city)
-            return city_list
+            return models.storage.related(City, "state_id", self.id)
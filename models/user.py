@@ -33,3 +33,20 @@ class User(BaseModel, Base):
         initializes a User instance
         """
         super().__init__(*args, **kwargs)
+
+    if models.storage_t != 'db':
+        @property
+        def places(self):
+            """
+            getter attribute - returns list of Place instances
+            """
+            from models.place import Place
+            return models.storage.related(Place, "user_id", self.id)
+
+        @property
+        def reviews(self):
+            """
+            getter attribute - returns list of Review instances
+            """
+            from models.review import Review
+            return models.storage.related(Review, "user_id", self.id)
@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+"""
+This module contains the tests for the API application.
+"""
+
+from api.v1 import app as app_module
+from api.v1.app import app
+import inspect
+import models
+import pep8
+import threading
+import unittest
+from models.state import State
+
+
+class TestAppDocs(unittest.TestCase):
+    """
+    checks the documentation and style of the API application
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        sets up the doc tests
+        """
+        cls.app_f = inspect.getmembers(app_module, inspect.isfunction)
+
+    def test_pep8_conformance_app(self):
+        """
+        tests conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/app.py',
+                                    'tests/test_api/test_v1/test_app.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_app_module_docstring(self):
+        """
+        tests for the presence of a docstring in the module
+        """
+        self.assertIsNot(app_module.__doc__, None,
+                         "app.py needs a docstring")
+        self.assertTrue(len(app_module.__doc__) >= 1,
+                        "app.py needs a docstring")
+
+    def test_app_func_docstrings(self):
+        """
+        tests for the presence of docstrings in app functions
+        """
+        for func in self.app_f:
+            if func[1].__module__ == app_module.__name__:
+                self.assertIsNot(func[1].__doc__, None,
+                                 "{:s} needs a docstring".format(func[0]))
+
+
+class TestApp(unittest.TestCase):
+    """
+    tests the API application
+    """
+
+    def setUp(self):
+        """
+        sets up a test client
+        """
+        app.config["TESTING"] = True
+        self.client = app.test_client()
+
+    def test_not_found(self):
+        """
+        tests that an unknown route returns a JSON 404
+        """
+        response = self.client.get("/api/v1/nope")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json(), {"error": "Not found"})
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_concurrent_requests(self):
+        """
+        tests that threads creating, reading, updating and deleting
+        states at once through the API all succeed and leave storage
+        consistent
+        """
+        errors = []
+        kept = []
+        before = models.storage.count(State)
+
+        def work(n):
+            client = app.test_client()
+            for i in range(20):
+                response = client.post("/api/v1/states",
+                                       json={"name": "S{}".format(i)})
+                if response.status_code != 201:
+                    errors.append(response.status_code)
+                    continue
+                url = "/api/v1/states/" + response.get_json()["id"]
+                for response in (client.get("/api/v1/states"),
+                                 client.put(url, json={"name": "T"}),
+                                 client.get(url),
+                                 client.get("/api/v1/stats")):
+                    if response.status_code != 200:
+                        errors.append(response.status_code)
+                if i % 2:
+                    kept.append(url[len("/api/v1/states/"):])
+                elif client.delete(url).status_code != 200:
+                    errors.append(404)
+        threads = [threading.Thread(target=work, args=(n,))
+                   for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for id in kept:
+            self.addCleanup(models.storage.save)
+            self.addCleanup(models.storage.delete,
+                            models.storage.get(State, id))
+        self.assertEqual(errors, [])
+        self.assertEqual(models.storage.count(State), before + len(kept))
+        for id in kept:
+            self.assertEqual(models.storage.get(State, id).name, "T")
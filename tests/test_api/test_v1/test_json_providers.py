@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+"""
+This module contains the tests for the API JSON providers.
+"""
+
+from api.v1 import json_providers
+from api.v1.app import app
+from api.v1.json_providers import ModelJSONProvider, OrjsonProvider
+from api.v1.json_providers import json_provider
+from datetime import datetime
+import inspect
+import json
+import os
+import pep8
+import unittest
+from unittest import mock
+import uuid
+
+
+class TestJSONProvidersDocs(unittest.TestCase):
+    """
+    checks the documentation and style of the JSON providers
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        sets up the doc tests
+        """
+        cls.provider_f = inspect.getmembers(OrjsonProvider,
+                                            inspect.isfunction)
+
+    def test_pep8_conformance_json_providers(self):
+        """
+        tests conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/json_providers.py',
+                                    'tests/test_api/test_v1/'
+                                    'test_json_providers.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_json_providers_module_docstring(self):
+        """
+        tests for the presence of a docstring in the module
+        """
+        self.assertIsNot(json_providers.__doc__, None,
+                         "json_providers.py needs a docstring")
+        self.assertTrue(len(json_providers.__doc__) >= 1,
+                        "json_providers.py needs a docstring")
+
+    def test_json_providers_func_docstrings(self):
+        """
+        tests for the presence of docstrings in OrjsonProvider methods
+        """
+        for func in self.provider_f:
+            if func[1].__module__ == json_providers.__name__:
+                self.assertIsNot(func[1].__doc__, None,
+                                 "{:s} needs a docstring".format(func[0]))
+
+
+class TestJSONProviders(unittest.TestCase):
+    """
+    tests the API JSON providers
+    """
+
+    def providers(self):
+        """
+        returns an instance of each provider available for app
+        """
+        return [cls(app) for cls in json_providers.providers.values()]
+
+    def test_choice(self):
+        """
+        tests that HBNB_API_JSON picks the provider, falling back to the
+        standard library one
+        """
+        for name, cls in (("stdlib", ModelJSONProvider),
+                          ("nope", ModelJSONProvider)):
+            with mock.patch.dict(os.environ, {"HBNB_API_JSON": name}):
+                self.assertIs(type(json_provider(app)), cls)
+        with mock.patch.dict(json_providers.providers, clear=True):
+            json_providers.providers["stdlib"] = ModelJSONProvider
+            self.assertIs(type(json_provider(app)), ModelJSONProvider)
+
+    def test_model_values(self):
+        """
+        tests that every provider writes datetimes like to_dict() and
+        UUIDs as strings, and reads back what it writes
+        """
+        when = datetime(2017, 9, 28, 21, 5, 54, 119427)
+        id = uuid.uuid4()
+        for provider in self.providers():
+            text = provider.dumps({"at": when, "id": id, "n": "é"})
+            self.assertEqual(json.loads(text), {
+                "at": "2017-09-28T21:05:54.119427", "id": str(id),
+                "n": "é"})
+            self.assertEqual(provider.loads(text), json.loads(text))
+
+    def test_response(self):
+        """
+        tests that every provider answers requests with the same JSON
+        and rejects malformed bodies
+        """
+        client = app.test_client()
+        for provider in self.providers():
+            with mock.patch.object(app, "json", provider):
+                response = client.get("/api/v1/status")
+                self.assertEqual(response.get_json(), {"status": "OK"})
+                self.assertEqual(response.mimetype, "application/json")
+                response = client.post("/api/v1/states", data="{",
+                                       content_type="application/json")
+                self.assertEqual(response.status_code, 400)
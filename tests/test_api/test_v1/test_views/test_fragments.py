@@ -0,0 +1,301 @@
+#!/usr/bin/python3
+"""
+This module contains the tests for the API JSON fragments.
+"""
+
+from api.v1.app import app
+from api.v1.json_providers import ModelJSONProvider, providers
+from api.v1.views import fragments
+from datetime import datetime
+from flask import jsonify
+import inspect
+import json
+import models
+import pep8
+import unittest
+from unittest import mock
+from models.amenity import Amenity
+from models.state import State
+
+
+class TestFragmentsDocs(unittest.TestCase):
+    """
+    checks the documentation and style of the fragments module
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        sets up the doc tests
+        """
+        cls.fragments_f = inspect.getmembers(fragments, inspect.isfunction)
+
+    def test_pep8_conformance_fragments(self):
+        """
+        tests conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/fragments.py',
+                                    'tests/test_api/test_v1/test_views/'
+                                    'test_fragments.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_fragments_module_docstring(self):
+        """
+        tests for the presence of a docstring in the module
+        """
+        self.assertIsNot(fragments.__doc__, None,
+                         "fragments.py needs a docstring")
+        self.assertTrue(len(fragments.__doc__) >= 1,
+                        "fragments.py needs a docstring")
+
+    def test_fragments_func_docstrings(self):
+        """
+        tests for the presence of docstrings in fragments functions
+        """
+        for func in self.fragments_f:
+            if func[1].__module__ == fragments.__name__:
+                self.assertIsNot(func[1].__doc__, None,
+                                 "{:s} needs a docstring".format(func[0]))
+
+
+class TestFragments(unittest.TestCase):
+    """
+    tests the API JSON fragments
+    """
+
+    def setUp(self):
+        """
+        empties the fragments kept by earlier tests
+        """
+        fragments.fragments.clear()
+
+    def test_jsonify_list_matches_jsonify(self):
+        """
+        tests that 'jsonify_list' returns the bytes jsonify returns,
+        with every provider
+        """
+        objs = [State(name="Californie"), Amenity(name="Wifi é")]
+        for cls in providers.values():
+            with mock.patch.object(app, "json", cls(app)), \
+                    app.test_request_context():
+                expected = jsonify([obj.to_dict() for obj in objs])
+                response = fragments.jsonify_list(objs)
+                self.assertEqual(response.get_data(), expected.get_data())
+                self.assertEqual(response.mimetype, expected.mimetype)
+                self.assertEqual(fragments.jsonify_list([]).get_data(),
+                                 jsonify([]).get_data())
+
+    def test_fragments_only_without_native_encoder(self):
+        """
+        tests that lists are streamed from fragments with the standard
+        library provider, and encoded at once with orjson
+        """
+        objs = [State(name="State {}".format(i)) for i in range(3)]
+        with mock.patch.object(app, "json", ModelJSONProvider(app)), \
+                app.test_request_context():
+            response = fragments.jsonify_list(objs)
+            self.assertTrue(response.is_streamed)
+            response.get_data()
+            self.assertEqual(len(fragments.fragments), 3)
+        fragments.fragments.clear()
+        if "orjson" in providers:
+            with mock.patch.object(app, "json", providers["orjson"](app)), \
+                    app.test_request_context():
+                self.assertFalse(fragments.jsonify_list(objs).is_streamed)
+            self.assertEqual(len(fragments.fragments), 0)
+
+    def test_fragment_follows_updated_at(self):
+        """
+        tests that a fragment is reused while updated_at is unchanged
+        and encoded again once it changes
+        """
+        state = State(name="Texas")
+        with app.app_context():
+            first = fragments.fragment(state)
+            self.assertIs(fragments.fragment(state), first)
+            state.name = "Utah"
+            state.updated_at = datetime.utcnow()
+            self.assertEqual(json.loads(fragments.fragment(state))["name"],
+                             "Utah")
+
+    def test_least_recently_used_evicted(self):
+        """
+        tests that past HBNB_API_FRAGMENTS entries the least recently
+        used fragment is evicted, and that 'forget' drops the fragment
+        of an object
+        """
+        states = [State(name=str(i)) for i in range(3)]
+        keys = ["State." + state.id for state in states]
+        with mock.patch.object(fragments, "max_fragments", 2), \
+                app.app_context():
+            for state in (states[0], states[1], states[0], states[2]):
+                fragments.fragment(state)
+            self.assertEqual(list(fragments.fragments), [keys[0], keys[2]])
+            fragments.forget(states[2])
+        self.assertEqual(list(fragments.fragments), [keys[0]])
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_delete_forgets_fragment(self):
+        """
+        tests that deleting an object through the API drops its fragment
+        """
+        client = app.test_client()
+        patcher = mock.patch.object(app, "json", ModelJSONProvider(app))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        amenity = client.post("/api/v1/amenities",
+                              json={"name": "Pool"}).get_json()
+        url = "/api/v1/amenities/" + amenity["id"]
+        client.get("/api/v1/amenities").get_data()
+        self.assertIn("Amenity." + amenity["id"], fragments.fragments)
+        client.delete(url)
+        self.assertNotIn("Amenity." + amenity["id"], fragments.fragments)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_list_endpoint_after_update(self):
+        """
+        tests that a list endpoint serves an object's new values after
+        it is updated through the API
+        """
+        client = app.test_client()
+        amenity = client.post("/api/v1/amenities",
+                              json={"name": "Pool"}).get_json()
+        self.addCleanup(client.delete, "/api/v1/amenities/" + amenity["id"])
+        url = "/api/v1/amenities"
+        self.assertIn(amenity, client.get(url).get_json())
+        client.put(url + "/" + amenity["id"], json={"name": "Spa"})
+        names = {a["id"]: a["name"] for a in client.get(url).get_json()}
+        self.assertEqual(names[amenity["id"]], "Spa")
+
+    def test_stream(self):
+        """
+        tests that 'stream' splits the JSON list into chunks that join
+        into the whole list
+        """
+        objs = [State(name="State {}".format(i)) for i in range(500)]
+        with app.test_request_context():
+            chunks = list(fragments.stream(objs, size=1024))
+            expected = jsonify([obj.to_dict() for obj in objs]).get_data()
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), expected)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_pagination(self):
+        """
+        tests that ?limit=&after= pages through a list endpoint in id
+        order, following the next cursor until the last page
+        """
+        client = app.test_client()
+        states = [State(name="Paged") for i in range(5)]
+        for state in states:
+            state.save()
+            self.addCleanup(state.delete)
+        self.addCleanup(models.storage.save)
+        url = "/api/v1/states?limit=2"
+        ids = []
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            page = response.get_json()
+            self.assertLessEqual(len(page), 2)
+            ids.extend(state["id"] for state in page)
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor:
+                self.assertEqual(cursor, page[-1]["id"])
+                self.assertIn('rel="next"', response.headers["Link"])
+                url = "/api/v1/states?limit=2&after=" + cursor
+            else:
+                url = None
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(ids), models.storage.count(State))
+        for limit in ("0", "-1", "a"):
+            response = client.get("/api/v1/states?limit=" + limit)
+            self.assertEqual(response.status_code, 400)
+
+    def test_validators(self):
+        """
+        tests that the ETag follows the order, ids and updated_at of the
+        objects, even when changes that would cancel out in a checksum
+        of each object are made together
+        """
+        objs = [State(name="A"), State(name="B")]
+        etag, modified = fragments.validators(objs)
+        self.assertEqual(fragments.validators(objs), (etag, modified))
+        self.assertEqual(modified.replace(tzinfo=None),
+                         max(obj.updated_at for obj in objs))
+        self.assertNotEqual(fragments.validators(objs[::-1])[0], etag)
+        self.assertNotEqual(fragments.validators(objs[:1])[0], etag)
+        self.assertNotEqual(fragments.validators([])[0], etag)
+        self.assertIsNone(fragments.validators([])[1])
+        stamps = [datetime(2024, 1, 1, 0, 0, 0, micro) for micro in (1, 4)]
+        for obj, stamp in zip(objs, stamps):
+            obj.updated_at = stamp
+        etag = fragments.validators(objs)[0]
+        for obj, stamp in zip(objs, stamps):
+            obj.updated_at = stamp.replace(microsecond=stamp.microsecond + 2)
+        self.assertNotEqual(fragments.validators(objs)[0], etag)
+        objs[0].updated_at, objs[1].updated_at = stamps[::-1]
+        self.assertNotEqual(fragments.validators(objs)[0], etag)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_conditional_get(self):
+        """
+        tests that object endpoints answer 304 while the client has the
+        current ETag or Last-Modified, list endpoints while it has the
+        current ETag, and both 200 once it changed
+        """
+        client = app.test_client()
+        state = client.post("/api/v1/states", json={"name": "Ohio"})
+        url = "/api/v1/states/" + state.get_json()["id"]
+        self.addCleanup(client.delete, url)
+        for path in (url, "/api/v1/states", url + "/cities",
+                     "/api/v1/states?limit=1"):
+            response = client.get(path)
+            response.get_data()
+            etag = response.headers["ETag"]
+            modified = response.headers.get("Last-Modified")
+            self.assertEqual(modified is not None, path == url)
+            response = client.get(path, headers={"If-None-Match": etag})
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.get_data(), b"")
+            self.assertEqual(response.headers["ETag"], etag)
+        modified = client.get(url).headers["Last-Modified"]
+        response = client.get(url, headers={"If-Modified-Since": modified})
+        self.assertEqual(response.status_code, 304)
+        etag = client.get(url).headers["ETag"]
+        client.put(url, json={"name": "Iowa"})
+        response = client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "Iowa")
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_conditional_get_after_delete(self):
+        """
+        tests that a list a member was deleted from is sent again, even
+        to a client asking with If-Modified-Since
+        """
+        client = app.test_client()
+        state = client.post("/api/v1/states", json={"name": "Ohio"})
+        url = "/api/v1/states/" + state.get_json()["id"]
+        self.addCleanup(client.delete, url)
+        cities = [client.post(url + "/cities", json={"name": name})
+                  .get_json()["id"] for name in ("Akron", "Dayton")]
+        response = client.get(url + "/cities")
+        response.get_data()
+        etag = response.headers["ETag"]
+        client.delete("/api/v1/cities/" + cities[0])
+        client.delete("/api/v1/cities/" + cities[1])
+        client.post(url + "/cities", json={"name": "Toledo"})
+        since = "Fri, 01 Jan 2100 00:00:00 GMT"
+        for headers in ({"If-None-Match": etag},
+                        {"If-Modified-Since": since}):
+            response = client.get(url + "/cities", headers=headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([city["name"] for city in response.get_json()],
+                             ["Toledo"])
@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+"""
+This module contains the tests for the status and stats routes.
+"""
+
+from api.v1.app import app
+from api.v1.views import index
+import inspect
+import models
+import pep8
+import unittest
+from unittest import mock
+
+
+class TestIndexDocs(unittest.TestCase):
+    """
+    checks the documentation and style of the index module
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        sets up the doc tests
+        """
+        cls.index_f = inspect.getmembers(index, inspect.isfunction)
+
+    def test_pep8_conformance_index(self):
+        """
+        tests conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/index.py',
+                                    'tests/test_api/test_v1/test_views/'
+                                    'test_index.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_index_module_docstring(self):
+        """
+        tests for the presence of a docstring in the module
+        """
+        self.assertIsNot(index.__doc__, None,
+                         "index.py needs a docstring")
+        self.assertTrue(len(index.__doc__) >= 1,
+                        "index.py needs a docstring")
+
+    def test_index_func_docstrings(self):
+        """
+        tests for the presence of docstrings in index functions
+        """
+        for func in self.index_f:
+            if func[1].__module__ == index.__name__:
+                self.assertIsNot(func[1].__doc__, None,
+                                 "{:s} needs a docstring".format(func[0]))
+
+
+class TestIndex(unittest.TestCase):
+    """
+    tests the status and stats routes
+    """
+
+    def test_status(self):
+        """
+        tests that /status reports OK
+        """
+        response = app.test_client().get("/api/v1/status")
+        self.assertEqual(response.get_json(), {"status": "OK"})
+
+    def test_stats(self):
+        """
+        tests that /stats counts the objects of each class
+        """
+        stats = app.test_client().get("/api/v1/stats").get_json()
+        self.assertEqual(sorted(stats), ["amenities", "cities", "places",
+                                         "reviews", "states", "users"])
+        self.assertEqual(stats["states"],
+                         models.storage.count(index.State))
+
+    def test_pool_stats(self):
+        """
+        tests that /stats/pool returns the storage pool metrics, or 404
+        when the storage has no pool
+        """
+        client = app.test_client()
+        metrics = {"checkouts": 3, "in_use": 1, "capacity": 15}
+        with mock.patch.object(index, "storage", mock.Mock(
+                spec=["pool_stats"], pool_stats=lambda: metrics)):
+            self.assertEqual(client.get("/api/v1/stats/pool").get_json(),
+                             metrics)
+        with mock.patch.object(index, "storage", mock.Mock(spec=[])):
+            response = client.get("/api/v1/stats/pool")
+            self.assertEqual(response.status_code, 404)
@@ -0,0 +1,189 @@
+#!/usr/bin/python3
+"""
+This module contains the tests for the Place routes.
+"""
+
+from api.v1.app import app
+from api.v1.views import places
+import inspect
+import models
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+import pep8
+import unittest
+
+
+class TestPlacesDocs(unittest.TestCase):
+    """
+    checks the documentation and style of the places module
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        sets up the doc tests
+        """
+        cls.places_f = inspect.getmembers(places, inspect.isfunction)
+
+    def test_pep8_conformance_places(self):
+        """
+        tests conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/places.py',
+                                    'tests/test_api/test_v1/test_views/'
+                                    'test_places.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_places_module_docstring(self):
+        """
+        tests for the presence of a docstring in the module
+        """
+        self.assertIsNot(places.__doc__, None,
+                         "places.py needs a docstring")
+        self.assertTrue(len(places.__doc__) >= 1,
+                        "places.py needs a docstring")
+
+    def test_places_func_docstrings(self):
+        """
+        tests for the presence of docstrings in places functions
+        """
+        for func in self.places_f:
+            if func[1].__module__ == places.__name__:
+                self.assertIsNot(func[1].__doc__, None,
+                                 "{:s} needs a docstring".format(func[0]))
+
+
+class TestPlacesSearch(unittest.TestCase):
+    """
+    tests the places_search route
+    """
+
+    def populate(self, cities, per_city=2):
+        """
+        saves a state with cities cities of per_city places each and
+        returns the state, the cities and the ids of their places
+        """
+        storage = models.storage
+        user = User(email="search@hbnb.io", password="pwd")
+        state = State(name="Search")
+        storage.new(user)
+        storage.new(state)
+        made = []
+        ids = []
+        for i in range(cities):
+            city = City(name="City {}".format(i), state_id=state.id)
+            storage.new(city)
+            made.append(city)
+            for j in range(per_city):
+                place = Place(name="Place {}".format(j), city_id=city.id,
+                              user_id=user.id)
+                storage.new(place)
+                ids.append(place.id)
+        storage.save()
+        self.addCleanup(self.remove, [user, state] + made, ids)
+        storage.close()
+        return state, made, ids
+
+    def remove(self, objs, place_ids):
+        """
+        deletes the places of place_ids and objs from storage
+        """
+        storage = models.storage
+        for place_id in place_ids:
+            storage.delete(storage.get(Place, place_id))
+        storage.save()
+        for obj in reversed(objs):
+            storage.delete(storage.get(type(obj), obj.id))
+        storage.save()
+        storage.close()
+
+    def search(self, data):
+        """
+        returns the sorted ids of the places found by the search data
+        """
+        response = app.test_client().post("/api/v1/places_search",
+                                          json=data)
+        self.assertEqual(response.status_code, 200)
+        return sorted(place["id"] for place in response.get_json())
+
+    def test_search_by_state_and_city(self):
+        """
+        tests that places are found through their state or their city
+        """
+        state, cities, ids = self.populate(3)
+        self.assertEqual(self.search({"states": [state.id]}), sorted(ids))
+        self.assertEqual(self.search({"cities": [cities[1].id]}),
+                         sorted(ids[2:4]))
+        self.assertEqual(self.search({"states": ["nope"]}), [])
+
+    def test_search_by_amenity(self):
+        """
+        tests that places are found through their amenities, and that
+        an unknown amenity finds nothing
+        """
+        storage = models.storage
+        state, cities, ids = self.populate(2)
+        wifi = Amenity(name="Wifi")
+        pool = Amenity(name="Pool")
+        storage.new(wifi)
+        storage.new(pool)
+        storage.save()
+        self.addCleanup(self.remove, [wifi, pool], [])
+        for place_id, amenities in ((ids[0], [wifi]), (ids[3], [wifi, pool]),
+                                    (ids[2], [pool])):
+            place = storage.get(Place, place_id)
+            for amenity in amenities:
+                if models.storage_t == "db":
+                    place.amenities.append(storage.get(Amenity, amenity.id))
+                else:
+                    place.amenity_ids = place.amenity_ids + [amenity.id]
+            place.save()
+        storage.close()
+        self.assertEqual(self.search({"amenities": [wifi.id]}),
+                         sorted([ids[0], ids[3]]))
+        self.assertEqual(self.search({"amenities": [pool.id]}),
+                         sorted([ids[2], ids[3]]))
+        self.assertEqual(self.search({"amenities": ["nope"]}), [])
+
+    def test_search_rejects_bad_json(self):
+        """
+        tests that a search that is not an object of lists is refused
+        with a 400 before anything is streamed
+        """
+        client = app.test_client()
+        for data in ([], "x", {"states": 5}, {"cities": "abc"},
+                     {"amenities": {"a": 1}}):
+            response = client.post("/api/v1/places_search", json=data)
+            self.assertEqual(response.status_code, 400)
+
+    @unittest.skipIf(models.storage_t != "db", "not testing db storage")
+    def test_search_statements_bounded(self):
+        """
+        tests that a search by state sends the same number of SQL
+        statements however many cities and places the state has
+        """
+        from sqlalchemy import event
+        engine = models.storage._DBStorage__engine
+        counts = []
+        for cities in (2, 8):
+            state = self.populate(cities, cities)[0]
+            statements = []
+
+            def listener(conn, cursor, statement, *args):
+                """
+                records the statements sent to the database
+                """
+                statements.append(statement)
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                found = self.search({"states": [state.id]})
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+            self.assertEqual(len(found), cities * cities)
+            counts.append(len(statements))
+        self.assertEqual(counts[0], counts[1])
+        self.assertLessEqual(counts[1], 3)
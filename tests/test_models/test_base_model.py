@@ -184,3 +184,52 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(old_created_at, new_created_at)
         self.assertTrue(mock_storage.new.called)
         self.assertTrue(mock_storage.save.called)
+
+    def test_from_dicts(self):
+        """
+        tests that 'from_dicts' builds the same instances as the
+        constructor does from the same dictionaries
+        """
+        dicts = [BaseModel(name="Betty").to_dict(), {"name": "Holberton"},
+                 {"id": "1", "created_at": datetime(2017, 9, 28)}]
+        for inst, kwargs in zip(BaseModel.from_dicts(dicts), dicts):
+            expected = BaseModel(**kwargs)
+            self.assertIs(type(inst), BaseModel)
+            self.assertEqual(inst.__dict__.get("name"), kwargs.get("name"))
+            if "id" in kwargs:
+                self.assertEqual(inst.id, expected.id)
+            if type(kwargs.get("created_at")) is str:
+                self.assertEqual(inst.created_at, expected.created_at)
+                self.assertEqual(inst.updated_at, expected.updated_at)
+            self.assertIs(type(inst.created_at), datetime)
+            self.assertIs(type(inst.updated_at), datetime)
+            self.assertNotIn("__class__", inst.__dict__)
+        self.assertEqual(dicts[1], {"name": "Holberton"})
+
+    @mock.patch('models.storage')
+    def test_from_dicts_skips_storage(self, mock_storage):
+        """
+        tests that 'from_dicts' does not report its attributes to storage
+        """
+        dicts = [BaseModel().to_dict()]
+        mock_storage.reset_mock()
+        BaseModel.from_dicts(dicts)
+        self.assertFalse(mock_storage.touch.called)
+
+    def test_to_dict_cache(self):
+        """
+        tests that 'to_dict' results are reused until an attribute is set
+        or the instance is saved, and are not exposed to mutation
+        """
+        inst = BaseModel()
+        first = inst.to_dict()
+        first["name"] = "mutated"
+        self.assertNotIn("name", inst.to_dict())
+        self.assertNotIn("name", inst.__dict__)
+        inst.name = "Holberton"
+        self.assertEqual(inst.to_dict()["name"], "Holberton")
+        old = inst.to_dict()["updated_at"]
+        time.sleep(1e-4)
+        with mock.patch('models.storage'):
+            inst.save()
+        self.assertNotEqual(inst.to_dict()["updated_at"], old)
@@ -17,7 +17,12 @@ from models.user import User
 import json
 import os
 import pep8
+import sqlite3
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+import time
 import unittest
+from unittest import mock
 DBStorage = db_storage.DBStorage
 classes = {"Amenity": Amenity,
            "City": City,
@@ -87,6 +92,43 @@ class TestDBStorageDocs(unittest.TestCase):
                             "{:s} method needs a docstring".format(func[0]))
 
 
+class TestMeteredQueuePool(unittest.TestCase):
+    """
+    tests the metrics of the MeteredQueuePool class
+    """
+
+    def test_metrics(self):
+        """
+        tests that the pool counts checkouts, timeouts, waits and the
+        connections in use out of its capacity
+        """
+        pool = db_storage.MeteredQueuePool(
+            lambda: sqlite3.connect(":memory:"), pool_size=1,
+            max_overflow=1, timeout=0.05)
+        first = pool.connect()
+        second = pool.connect()
+        metrics = pool.metrics()
+        self.assertEqual(metrics["checkouts"], 2)
+        self.assertEqual(metrics["in_use"], 2)
+        self.assertEqual(metrics["capacity"], 2)
+        self.assertEqual(metrics["saturation"], 1)
+        with self.assertRaises(TimeoutError):
+            pool.connect()
+        first.close()
+        second.close()
+        metrics = pool.metrics()
+        self.assertEqual(metrics["timeouts"], 1)
+        self.assertEqual(metrics["in_use"], 0)
+        self.assertEqual(metrics["peak"], 2)
+        self.assertEqual(metrics["saturation"], 0)
+        self.assertGreaterEqual(metrics["wait_ms"], metrics["wait_max_ms"])
+        pool.dispose()
+        unlimited = db_storage.MeteredQueuePool(
+            lambda: sqlite3.connect(":memory:"), max_overflow=-1)
+        self.assertIsNone(unlimited.capacity())
+        self.assertIsNone(unlimited.metrics()["saturation"])
+
+
 class TestFileStorage(unittest.TestCase):
     """
     tests the DBStorage class and its methods
@@ -174,3 +216,189 @@ class TestFileStorage(unittest.TestCase):
         self.storage.save()
         self.storage.delete(state)
         self.assertIsNone(self.storage.get(State, state.id))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_count_from_counters(self):
+        """
+        tests that 'count' follows commits and uncommitted changes
+        without querying the database again
+        """
+        initial_count = self.storage.count(State)
+        statements = []
+        engine = self.storage._DBStorage__engine
+
+        def listener(conn, cursor, statement, *args):
+            """
+            records the statements sent to the database
+            """
+            statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        self.addCleanup(event.remove, engine, "before_cursor_execute",
+                        listener)
+        for i in range(10):
+            self.assertEqual(self.storage.count(State), initial_count)
+        self.assertEqual(statements, [])
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.assertEqual(self.storage.count(State), initial_count + 1)
+        self.storage.save()
+        self.assertEqual(self.storage.count(State), initial_count + 1)
+        self.storage.delete(state)
+        self.assertEqual(self.storage.count(State), initial_count)
+        self.storage.save()
+        self.assertEqual(self.storage.count(State), initial_count)
+        self.storage.new(State(name="Texas"))
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), initial_count)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_count_refreshed_after_ttl(self):
+        """
+        tests that 'count' reads the class counts again, in one query,
+        once they are older than HBNB_MYSQL_COUNTS_TTL
+        """
+        initial_count = self.storage.count(State)
+        engine = self.storage._DBStorage__engine
+        with engine.begin() as conn:
+            conn.execute(State.__table__.insert().values(
+                id="ttl-state", name="Elsewhere",
+                created_at=datetime.utcnow(), updated_at=datetime.utcnow()))
+        self.addCleanup(self.remove_state, "ttl-state")
+        self.assertEqual(self.storage.count(State), initial_count)
+        statements = []
+
+        def listener(conn, cursor, statement, *args):
+            """
+            records the statements sent to the database
+            """
+            statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        self.addCleanup(event.remove, engine, "before_cursor_execute",
+                        listener)
+        later = time.monotonic() + self.storage._DBStorage__counts_ttl + 1
+        with mock.patch.object(db_storage.time, "monotonic",
+                               return_value=later):
+            self.assertEqual(self.storage.count(State), initial_count + 1)
+            self.assertEqual(self.storage.count(), self.storage.count())
+        self.assertEqual(len(statements), 1)
+        self.assertIn("UNION ALL", statements[0])
+
+    def remove_state(self, id):
+        """
+        deletes the state row id behind the storage
+        """
+        with self.storage._DBStorage__engine.begin() as conn:
+            conn.execute(State.__table__.delete().where(
+                State.__table__.c.id == id))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_all_parallel_keeps_identity(self):
+        """
+        tests that 'all' without a class reads the classes in parallel
+        and returns the objects the session already holds
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        held = self.storage.get(State, state.id)
+        fetch = db_storage.DBStorage._DBStorage__fetch
+        with mock.patch.object(db_storage.DBStorage, "_DBStorage__fetch",
+                               autospec=True, side_effect=fetch) as fetched:
+            objs = self.storage.all()
+        self.assertEqual(fetched.call_count, len(db_storage.classes))
+        self.assertIs(objs["State." + state.id], held)
+        session = self.storage._DBStorage__session
+        self.assertTrue(all(obj in session for obj in objs.values()))
+        self.assertEqual(len(objs), self.storage.count())
+        self.storage.delete(held)
+        self.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_all_falls_back_with_changes(self):
+        """
+        tests that 'all' without a class queries in the session while it
+        holds pending or dirty changes, which other connections miss
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        held = self.storage.get(State, state.id)
+        pending = State(name="Texas")
+        with mock.patch.object(db_storage.DBStorage, "_DBStorage__fetch",
+                               autospec=True) as fetched:
+            self.storage.new(pending)
+            self.assertIs(self.storage.all()["State." + pending.id],
+                          pending)
+            self.storage.save()
+            held.name = "Kansas"
+            objs = self.storage.all()
+        fetched.assert_not_called()
+        self.assertEqual(objs["State." + state.id].name, "Kansas")
+        self.storage.delete(held)
+        self.storage.delete(pending)
+        self.storage.save()
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_reload_warms_pool(self):
+        """
+        tests that 'reload' opens the warm-up connections in the pool
+        """
+        stats = self.storage.pool_stats()
+        self.assertGreaterEqual(stats["peak"],
+                                self.storage._DBStorage__warm)
+        self.assertEqual(stats["in_use"], 0)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_eager_loading(self):
+        """
+        tests that 'all' and 'get' with load read the named relationships
+        in one query each instead of one query per object
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        for i in range(5):
+            self.storage.new(City(name=str(i), state_id=state.id))
+        self.storage.save()
+        statements = []
+        engine = self.storage._DBStorage__engine
+
+        def listener(conn, cursor, statement, *args):
+            """
+            records the statements sent to the database
+            """
+            statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        self.addCleanup(event.remove, engine, "before_cursor_execute",
+                        listener)
+        self.storage.close()
+        for state in self.storage.all(State, load=["cities"]).values():
+            [city.name for city in state.cities]
+        self.assertEqual(len(statements), 2)
+        self.storage.close()
+        del statements[:]
+        state = self.storage.get(State, state.id, load=["cities.places"])
+        [city.places for city in state.cities]
+        self.assertEqual(len(statements), 3)
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_pool_settings(self):
+        """
+        tests that the pool follows the HBNB_MYSQL_POOL_* settings and
+        that 'reload' warms at most the pool capacity
+        """
+        env = {"HBNB_MYSQL_POOL_SIZE": "1", "HBNB_MYSQL_MAX_OVERFLOW": "1",
+               "HBNB_MYSQL_POOL_TIMEOUT": "0.5",
+               "HBNB_MYSQL_POOL_PRE_PING": "true",
+               "HBNB_MYSQL_POOL_WARM": "50"}
+        with mock.patch.dict(os.environ, env):
+            storage = DBStorage()
+        start = time.monotonic()
+        storage.reload()
+        self.addCleanup(storage.close)
+        self.assertLess(time.monotonic() - start, 0.5)
+        stats = storage.pool_stats()
+        self.assertEqual((stats["capacity"], stats["peak"]), (2, 2))
+        self.assertEqual(stats["timeouts"], 0)
+        self.assertTrue(storage._DBStorage__engine.pool._pre_ping)
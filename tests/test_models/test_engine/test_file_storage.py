@@ -5,12 +5,20 @@ This module contains the tests for the FileStorage class.
 
 from datetime import datetime
 import inspect
+import io
 import json
+import multiprocessing
 import models
+import os
 import pep8
+import shutil
+import threading
+import time
 import unittest
+from unittest import mock
 from models.base_model import BaseModel
-from models.engine.file_storage import FileStorage
+from models.engine.file_storage import FileStorage, iter_items
+from models.engine.locks import FileLock
 from models.amenity import Amenity
 from models.city import City
 from models.place import Place
@@ -104,7 +112,8 @@ class TestFileStorage(unittest.TestCase):
         """
         self.storage._FileStorage__objects.clear()
 
-    @unittest.skipIf(models.storage_t == "db", "not testing file storage")
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
     def test_all_returns_dict(self):
         """
         tests that 'all' returns a dictionary
@@ -112,7 +121,8 @@ class TestFileStorage(unittest.TestCase):
         new_dict = self.storage.all()
         self.assertIsInstance(new_dict, dict)
 
-    @unittest.skipIf(models.storage_t == "db", "not testing file storage")
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
     def test_new(self):
         """
         tests that 'new' adds an object to the storage dictionary
@@ -123,7 +133,8 @@ class TestFileStorage(unittest.TestCase):
             instance_key = f"{instance.__class__.__name__}.{instance.id}"
             self.assertIn(instance_key, self.storage._FileStorage__objects)
 
-    @unittest.skipIf(models.storage_t == "db", "not testing file storage")
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
     def test_save(self):
         """
         tests that 'save' properly saves objects to file.json
@@ -136,7 +147,8 @@ class TestFileStorage(unittest.TestCase):
         instance_key = f"{st_instance.__class__.__name__}.{st_instance.id}"
         self.assertIn(instance_key, file_stuff)
 
-    @unittest.skipIf(models.storage_t == "db", "not testing file storage")
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
     def test_reload(self):
         """
         tests that 'reload' properly reloads objects from file.json
@@ -149,7 +161,8 @@ class TestFileStorage(unittest.TestCase):
         instance_key = f"{c_instance.__class__.__name__}.{c_instance.id}"
         self.assertIn(instance_key, self.storage._FileStorage__objects)
 
-    @unittest.skipIf(models.storage_t == "db", "not testing file storage")
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
     def test_delete(self):
         """
         tests that 'delete' properly deletes objects from __objects
@@ -160,7 +173,8 @@ class TestFileStorage(unittest.TestCase):
         self.storage.delete(u_instance)
         self.assertNotIn(instance_key, self.storage._FileStorage__objects)
 
-    @unittest.skipIf(models.storage_t == "db", "not testing file storage")
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
     def test_get(self):
         """
         tests that 'get' retrieves one object
@@ -172,7 +186,8 @@ class TestFileStorage(unittest.TestCase):
         got_instance = self.storage.get(State, instance.id)
         self.assertEqual(instance.id, got_instance.id)
 
-    @unittest.skipIf(models.storage_t == "db", "not testing file storage")
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
     def test_count(self):
         """
         tests that 'count' counts the number of objects in storage
@@ -182,3 +197,619 @@ class TestFileStorage(unittest.TestCase):
         state_instance.save()
         self.assertEqual(self.storage.count(), initial_count + 1)
         self.assertEqual(self.storage.count(State), 1)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_all_cls(self):
+        """
+        tests that 'all' with a class returns only objects of that class
+        """
+        state = State(name="Oklahoma")
+        city = City(name="Tulsa")
+        self.storage.new(state)
+        self.storage.new(city)
+        state_key = "State." + state.id
+        self.assertEqual(self.storage.all(State), {state_key: state})
+        self.assertEqual(self.storage.all("State"), {state_key: state})
+        self.assertEqual(self.storage.all(Review), {})
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_class_buckets_follow_objects(self):
+        """
+        tests that the class buckets stay in step with __objects
+        """
+        objects = self.storage._FileStorage__objects
+        state = State(name="Oklahoma")
+        other = State(name="Texas")
+        self.storage.new(state)
+        self.storage.new(other)
+        self.assertEqual(self.storage.count(State), 2)
+        self.storage.delete(state)
+        self.assertEqual(self.storage.count(State), 1)
+        self.assertNotIn("State." + state.id, self.storage.all(State))
+        objects.pop("State." + other.id)
+        self.assertEqual(self.storage.count(State), 0)
+        self.storage.new(state)
+        objects.clear()
+        self.assertEqual(self.storage.all(State), {})
+        self.assertEqual(self.storage.count(BaseModel), 0)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_related(self):
+        """
+        tests that 'related' follows new, delete and foreign key changes
+        """
+        state = State(name="Oklahoma")
+        other = State(name="Texas")
+        city = City(name="Tulsa", state_id=state.id)
+        self.storage.new(state)
+        self.storage.new(other)
+        self.storage.new(city)
+        self.assertEqual(self.storage.related(City, "state_id", state.id),
+                         [city])
+        self.assertEqual(state.cities, [city])
+        city.state_id = other.id
+        self.assertEqual(state.cities, [])
+        self.assertEqual(other.cities, [city])
+        self.storage.delete(city)
+        self.assertEqual(other.cities, [])
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_related_after_reload(self):
+        """
+        tests that the reverse indexes are rebuilt by 'reload'
+        """
+        place = Place(name="Cabin")
+        review = Review(text="Cozy", place_id=place.id, user_id="u1")
+        self.storage.new(place)
+        self.storage.new(review)
+        self.storage.save()
+        self.storage._FileStorage__objects.clear()
+        self.storage.reload()
+        place = self.storage.get(Place, place.id)
+        self.assertEqual([r.id for r in place.reviews], [review.id])
+        self.assertEqual(len(self.storage.related(Review, "user_id", "u1")),
+                         1)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_save_encodes_only_changed(self):
+        """
+        tests that 'save' only calls to_dict on objects changed since
+        the last save
+        """
+        states = [State(name="Oklahoma"), State(name="Texas"),
+                  State(name="Kansas")]
+        for state in states:
+            self.storage.new(state)
+        self.storage.save()
+        states[1].name = "Nebraska"
+        self.storage.delete(states[2])
+        with mock.patch.object(BaseModel, "to_dict", autospec=True,
+                               side_effect=BaseModel.to_dict) as to_dict:
+            self.storage.save()
+        self.assertEqual(to_dict.call_count, 1)
+        with open("file.json", "r") as f:
+            file_stuff = json.load(f)
+        self.assertEqual(file_stuff, {"State." + states[0].id:
+                                      states[0].to_dict(),
+                                      "State." + states[1].id:
+                                      states[1].to_dict()})
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_close_skips_unchanged_file(self):
+        """
+        tests that 'close' only reloads when file.json changed on disk
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.save()
+        with mock.patch.object(FileStorage, "reload") as reload:
+            self.storage.close()
+        reload.assert_not_called()
+        with open("file.json", "r") as f:
+            file_stuff = json.load(f)
+        file_stuff["State." + state.id]["name"] = "Texas"
+        with open("file.json", "w") as f:
+            json.dump(file_stuff, f)
+        self.storage.close()
+        self.assertEqual(self.storage.get(State, state.id).name, "Texas")
+
+    def test_iter_items(self):
+        """
+        tests that 'iter_items' yields the same pairs as json.load for
+        values that span several chunks
+        """
+        jo = {"State.{}".format(i): {"name": '}, "x": {', "ids": [i, {}]}
+              for i in range(50)}
+        for text in (json.dumps(jo), json.dumps(jo, indent=4), "{}"):
+            items = iter_items(io.StringIO(text), chunk_size=7)
+            self.assertEqual(dict(items), json.loads(text))
+        with self.assertRaises(ValueError):
+            list(iter_items(io.StringIO('{"State.1": {"name": "x"}')))
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_reload_parallel(self):
+        """
+        tests that 'reload' with several workers loads every object and
+        falls back to the streaming reader for other layouts
+        """
+        states = [State(name=str(i)) for i in range(20)]
+        for state in states:
+            self.storage.new(state)
+        self.storage.save()
+        expected = sorted("State." + state.id for state in states)
+        with mock.patch.object(FileStorage, "_FileStorage__workers", 2):
+            self.storage._FileStorage__objects.clear()
+            self.storage.reload()
+            self.assertEqual(sorted(self.storage.all(State)), expected)
+            with open("file.json", "r") as f:
+                file_stuff = json.load(f)
+            with open("file.json", "w") as f:
+                json.dump(file_stuff, f, indent=4)
+            self.storage._FileStorage__objects.clear()
+            self.storage.reload()
+            self.assertEqual(sorted(self.storage.all(State)), expected)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_convert(self):
+        """
+        tests that 'convert' rewrites file.json in another format that
+        'reload' reads back
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.convert("binary")
+        self.addCleanup(self.storage.convert, "json")
+        with open("file.json", "rb") as f:
+            self.assertEqual(f.read(1), b"\x80")
+        self.storage._FileStorage__objects.clear()
+        self.storage.reload()
+        self.assertEqual(self.storage.get(State, state.id).created_at,
+                         state.created_at)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_threads(self):
+        """
+        tests that threads adding, changing and saving objects at once
+        leave every object in storage and in file.json
+        """
+        def work():
+            for i in range(50):
+                state = State(name="State")
+                self.storage.new(state)
+                state.name = str(i)
+                self.storage.all(State)
+                self.storage.save()
+        threads = [threading.Thread(target=work) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.storage.count(State), 400)
+        with open("file.json") as f:
+            self.assertEqual(len(json.load(f)), 400)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_group_commit(self):
+        """
+        tests that in group commit mode concurrent saves share durable
+        writes and each returns once its objects are in file.json
+        """
+        synced = []
+
+        def fsync(fd):
+            synced.append(fd)
+            time.sleep(0.05)
+
+        def work():
+            state = State(name="State")
+            self.storage.new(state)
+            self.storage.save()
+            with open("file.json") as f:
+                if "State." + state.id not in json.load(f):
+                    missing.append(state.id)
+        missing = []
+        threads = [threading.Thread(target=work) for i in range(20)]
+        with mock.patch.object(FileStorage, "_FileStorage__group_commit",
+                               True), mock.patch("os.fsync", fsync):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(missing, [])
+        self.assertLess(len(synced), 20)
+        self.assertEqual(self.storage.count(State), 20)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_write_behind(self):
+        """
+        tests that with HBNB_FILE_FLUSH_MS set 'save' returns before the
+        write, which the flusher makes within the interval, and that the
+        exit handler writes what is still waiting
+        """
+        with mock.patch.object(FileStorage, "_FileStorage__flush_ms", 100):
+            state = State(name="Nevada")
+            self.storage.new(state)
+            self.storage.save()
+            self.assertFalse(os.path.exists("file.json") and
+                             state.id in open("file.json").read())
+            for i in range(100):
+                time.sleep(0.05)
+                if (os.path.exists("file.json") and
+                        state.id in open("file.json").read()):
+                    break
+            else:
+                self.fail("the flusher did not write file.json")
+            city = City(name="Reno", state_id=state.id)
+            self.storage.new(city)
+            self.storage.save()
+            self.storage._FileStorage__finish()
+        with open("file.json") as f:
+            self.assertIn("City." + city.id, json.load(f))
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_write_behind_survives_errors(self):
+        """
+        tests that the flusher logs a failed write and writes the changes
+        at its next try
+        """
+        flush = FileStorage.flush
+        calls = []
+
+        def failing(storage):
+            """
+            fails the first flush, then flushes
+            """
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("boom")
+            flush(storage)
+        with mock.patch.object(FileStorage, "_FileStorage__flush_ms", 50), \
+                mock.patch.object(FileStorage, "flush", failing), \
+                self.assertLogs("models.engine.file_storage", "ERROR"):
+            state = State(name="Nevada")
+            self.storage.new(state)
+            self.storage.save()
+            for i in range(100):
+                time.sleep(0.05)
+                if (os.path.exists("file.json") and
+                        state.id in open("file.json").read()):
+                    break
+            else:
+                self.fail("the flusher did not write file.json")
+            self.assertTrue(self.storage._FileStorage__flusher.is_alive())
+            self.storage._FileStorage__finish()
+        self.assertGreaterEqual(len(calls), 2)
+
+    @unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                     "not testing file storage")
+    def test_page(self):
+        """
+        tests that 'page' walks objects in id order through inserts and
+        deletes, optionally by foreign key
+        """
+        state = State(name="Oklahoma")
+        cities = [City(name=str(i), state_id=state.id) for i in range(5)]
+        for obj in [state, City(name="x", state_id="other")] + cities:
+            self.storage.new(obj)
+        ids = sorted(city.id for city in cities)
+        first = self.storage.page(City, 2, attr="state_id", value=state.id)
+        self.assertEqual([city.id for city in first], ids[:2])
+        rest = self.storage.page(City, 10, ids[1], "state_id", state.id)
+        self.assertEqual([city.id for city in rest], ids[2:])
+        self.assertEqual(len(self.storage.page(City, 10)), 6)
+        self.storage.delete(cities[0])
+        city = City(name="new", state_id=state.id)
+        self.storage.new(city)
+        ids = sorted(set(ids) - {cities[0].id} | {city.id})
+        pages, after = [], None
+        while True:
+            page = self.storage.page(City, 2, after, "state_id", state.id)
+            pages.extend(obj.id for obj in page)
+            if len(page) < 2:
+                break
+            after = page[-1].id
+        self.assertEqual(pages, ids)
+        everything = [obj.id for obj in self.storage.page("City", 100)]
+        self.assertEqual(everything, sorted(everything))
+        self.assertEqual(len(everything), 6)
+        link = ("City", "state_id", state.id)
+        objects = self.storage._FileStorage__objects
+        self.assertIs(objects.sorted_link_keys(link),
+                      objects.sorted_link_keys(link))
+        self.storage.page(City, 2, attr="state_id", value="other")
+        city.state_id = "other"
+        moved = self.storage.page(City, 10, attr="state_id", value="other")
+        self.assertIn(city.id, [obj.id for obj in moved])
+        self.assertEqual([obj.id for obj in moved],
+                         sorted(obj.id for obj in moved))
+        left = self.storage.page(City, 10, attr="state_id", value=state.id)
+        self.assertEqual([obj.id for obj in left],
+                         [id for id in ids if id != city.id])
+
+
+@unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                 "not testing file storage")
+class TestFileStorageJournal(unittest.TestCase):
+    """
+    tests the journal mode of the FileStorage class
+    """
+
+    def setUp(self):
+        """
+        starts each test from an empty storage in journal mode
+        """
+        self.storage = FileStorage()
+        self.storage._FileStorage__objects.clear()
+        self.storage.compact()
+        patcher = mock.patch.object(FileStorage, "_FileStorage__journal",
+                                    True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """
+        folds the journal back into file.json and clears storage
+        """
+        self.storage._FileStorage__objects.clear()
+        self.storage.compact()
+
+    def test_save_appends_to_journal(self):
+        """
+        tests that 'save' appends records instead of rewriting file.json
+        """
+        state = State(name="Oklahoma")
+        state.save()
+        with open("file.json", "r") as f:
+            self.assertNotIn("State." + state.id, json.load(f))
+        with open("file.json.log", "r") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records, [["State." + state.id, state.to_dict()]])
+
+    def test_reload_replays_journal(self):
+        """
+        tests that 'reload' replays updates and deletions from the journal
+        """
+        state = State(name="Oklahoma")
+        gone = State(name="Texas")
+        state.save()
+        gone.save()
+        state.name = "Kansas"
+        self.storage.delete(gone)
+        self.storage.save()
+        self.storage._FileStorage__objects.clear()
+        self.storage.reload()
+        self.assertEqual(self.storage.get(State, state.id).name, "Kansas")
+        self.assertIsNone(self.storage.get(State, gone.id))
+
+    def test_compaction(self):
+        """
+        tests that the journal is folded into file.json past its limit
+        """
+        with mock.patch.object(FileStorage, "_FileStorage__journal_max", 1):
+            State(name="Oklahoma").save()
+            self.assertTrue(os.path.exists("file.json.log"))
+            State(name="Texas").save()
+        self.assertFalse(os.path.exists("file.json.log"))
+        with open("file.json", "r") as f:
+            self.assertEqual(len(json.load(f)), 2)
+
+    def test_torn_record_is_dropped(self):
+        """
+        tests that a partially written last record is ignored
+        """
+        state = State(name="Oklahoma")
+        state.save()
+        with open("file.json.log", "a") as f:
+            f.write('["State.torn", {"__class__": "St')
+        self.storage._FileStorage__objects.clear()
+        self.storage.reload()
+        self.assertEqual(list(self.storage.all()), ["State." + state.id])
+        other = State(name="Texas")
+        other.save()
+        self.storage._FileStorage__objects.clear()
+        self.storage.reload()
+        self.assertEqual(self.storage.count(State), 2)
+
+
+@unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                 "not testing file storage")
+class TestFileStorageSharded(unittest.TestCase):
+    """
+    tests the sharded layout of the FileStorage class
+    """
+
+    def setUp(self):
+        """
+        starts each test from an empty storage in the sharded layout
+        """
+        self.storage = FileStorage()
+        self.storage._FileStorage__objects.clear()
+        self.storage.compact()
+        patcher = mock.patch.object(FileStorage, "_FileStorage__sharded",
+                                    True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.storage._FileStorage__loaded.update(classes)
+
+    def tearDown(self):
+        """
+        removes the shards and clears storage
+        """
+        shutil.rmtree("file.json.d", ignore_errors=True)
+        self.storage._FileStorage__dirty_shards.clear()
+        self.storage._FileStorage__loaded.clear()
+        self.storage._FileStorage__objects.clear()
+
+    def test_save_writes_changed_shards(self):
+        """
+        tests that 'save' writes one file per class and only rewrites
+        the shards of changed objects
+        """
+        state = State(name="Oklahoma")
+        city = City(name="Tulsa", state_id=state.id)
+        state.save()
+        city.save()
+        self.assertEqual(sorted(os.listdir("file.json.d")),
+                         ["City.json", "State.json"])
+        city_ino = os.stat("file.json.d/City.json").st_ino
+        state_ino = os.stat("file.json.d/State.json").st_ino
+        state.name = "Texas"
+        self.storage.save()
+        self.assertEqual(os.stat("file.json.d/City.json").st_ino, city_ino)
+        self.assertNotEqual(os.stat("file.json.d/State.json").st_ino,
+                            state_ino)
+        with open("file.json.d/State.json", "r") as f:
+            self.assertEqual(json.load(f)["State." + state.id]["name"],
+                             "Texas")
+        self.storage.delete(city)
+        self.storage.save()
+        self.assertEqual(os.listdir("file.json.d"), ["State.json"])
+
+    def test_hash_shards(self):
+        """
+        tests that classes are split by id hash into HBNB_FILE_SHARDS files
+        """
+        with mock.patch.object(FileStorage, "_FileStorage__shard_count", 4):
+            for i in range(20):
+                State(name=str(i)).save()
+            files = os.listdir("file.json.d")
+            self.assertTrue(1 < len(files) <= 4)
+            self.storage._FileStorage__objects.clear()
+            self.storage.reload()
+        self.assertEqual(self.storage.count(State), 20)
+
+    def test_change_shard_count(self):
+        """
+        tests that objects saved under another HBNB_FILE_SHARDS move to
+        the shards of the current count without undoing later changes
+        """
+        states = [State(name="orig") for i in range(10)]
+        for state in states:
+            self.storage.new(state)
+        self.storage.save()
+        objects = self.storage._FileStorage__objects
+        with mock.patch.object(FileStorage, "_FileStorage__shard_count", 3):
+            for i in range(2):
+                objects.clear()
+                self.storage.reload()
+                if i == 0:
+                    got = self.storage.get(State, states[0].id)
+                    got.name = "new"
+                    got.save()
+                    self.storage.delete(self.storage.get(State,
+                                                         states[1].id))
+                    self.storage.save()
+            self.assertNotIn("State.json", os.listdir("file.json.d"))
+        self.assertEqual(self.storage.count(State), 9)
+        self.assertEqual(self.storage.get(State, states[0].id).name, "new")
+        self.assertIsNone(self.storage.get(State, states[1].id))
+
+    def test_reload_wanted_classes(self):
+        """
+        tests that 'reload' only reads the shards of HBNB_STORAGE_CLASSES
+        and loads other classes when they are first asked for
+        """
+        state = State(name="Oklahoma")
+        city = City(name="Tulsa", state_id=state.id)
+        state.save()
+        city.save()
+        self.storage._FileStorage__loaded.clear()
+        self.storage._FileStorage__objects.clear()
+        with mock.patch.object(FileStorage, "_FileStorage__wanted",
+                               ["State"]):
+            self.storage.reload()
+        objects = self.storage._FileStorage__objects
+        self.assertEqual(list(objects), ["State." + state.id])
+        self.assertEqual([c.id for c in state.cities], [city.id])
+        self.assertIn("City." + city.id, objects)
+
+
+@unittest.skipIf(models.storage_t in ("db", "sqlite"),
+                 "not testing file storage")
+class TestFileStorageShared(unittest.TestCase):
+    """
+    tests FileStorage shared by several processes
+    """
+
+    def setUp(self):
+        """
+        starts each test from an empty storage shared between processes
+        """
+        self.storage = FileStorage()
+        self.storage._FileStorage__objects.clear()
+        self.storage.compact()
+        for name, value in (("shared", True),
+                            ("file_lock", FileLock("file.json.lock"))):
+            patcher = mock.patch.object(FileStorage, "_FileStorage__" + name,
+                                        value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """
+        clears storage and removes the lock and generation files
+        """
+        self.storage._FileStorage__objects.clear()
+        self.storage.compact()
+        for path in ("file.json.lock", "file.json.gen"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def run_workers(self, count=3, saves=20):
+        """
+        saves a new state saves times in each of count forked processes
+        """
+        def work():
+            for i in range(saves):
+                self.storage.new(State(name="State"))
+                self.storage.save()
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=work) for i in range(count)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+
+    def test_processes_keep_each_others_objects(self):
+        """
+        tests that processes saving the whole file at once keep every
+        object and that 'close' brings them into this process
+        """
+        state = State(name="Kept")
+        self.storage.new(state)
+        self.run_workers()
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 61)
+        self.storage.save()
+        with open("file.json") as f:
+            self.assertEqual(len(json.load(f)), 61)
+        self.assertIn("State." + state.id, self.storage.all(State))
+
+    def test_close_reads_only_new_journal_records(self):
+        """
+        tests that in journal mode 'close' applies the records other
+        processes appended without reading file.json again
+        """
+        with mock.patch.object(FileStorage, "_FileStorage__journal", True):
+            self.run_workers()
+            with mock.patch.object(FileStorage, "_FileStorage__load_file",
+                                   side_effect=AssertionError):
+                self.storage.close()
+            self.assertEqual(self.storage.count(State), 60)
+            generation = self.storage._FileStorage__generation
+            with open("file.json.gen") as f:
+                self.assertEqual(int(f.read()), generation)
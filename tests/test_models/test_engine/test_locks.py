@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+"""
+This module contains the tests for the ReadWriteLock class.
+"""
+
+import inspect
+import pep8
+import threading
+import time
+import unittest
+from models.engine.locks import ReadWriteLock
+
+
+class TestReadWriteLockDocs(unittest.TestCase):
+    """
+    checks the documentation and style of ReadWriteLock class
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        sets up the doc tests
+        """
+        cls.lock_f = inspect.getmembers(ReadWriteLock, inspect.isfunction)
+
+    def test_pep8_conformance_locks(self):
+        """
+        tests conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/locks.py',
+                                    'tests/test_models/test_engine/'
+                                    'test_locks.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_locks_class_docstring(self):
+        """
+        tests for the presence of a docstring in the class
+        """
+        self.assertIsNot(ReadWriteLock.__doc__, None,
+                         "ReadWriteLock class needs a docstring")
+        self.assertTrue(len(ReadWriteLock.__doc__) >= 1,
+                        "ReadWriteLock class needs a docstring")
+
+    def test_locks_func_docstrings(self):
+        """
+        tests for the presence of docstrings in ReadWriteLock methods
+        """
+        for func in self.lock_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestReadWriteLock(unittest.TestCase):
+    """
+    tests the ReadWriteLock class
+    """
+
+    def test_readers_share(self):
+        """
+        tests that a second thread can read while the first one reads
+        """
+        lock = ReadWriteLock()
+        done = threading.Event()
+
+        def read():
+            with lock.read():
+                done.set()
+        with lock.read():
+            thread = threading.Thread(target=read)
+            thread.start()
+            self.assertTrue(done.wait(5))
+        thread.join()
+
+    def test_writer_excludes(self):
+        """
+        tests that a reader waits until the writer releases the lock
+        """
+        lock = ReadWriteLock()
+        order = []
+
+        def read():
+            with lock.read():
+                order.append("read")
+        with lock.write():
+            thread = threading.Thread(target=read)
+            thread.start()
+            time.sleep(0.05)
+            order.append("write")
+        thread.join()
+        self.assertEqual(order, ["write", "read"])
+
+    def test_reentrant(self):
+        """
+        tests that a thread may nest reads and writes under its write
+        """
+        lock = ReadWriteLock()
+        with lock.write():
+            with lock.write(), lock.read():
+                pass
+        with lock.read(), lock.read():
+            pass
+        with lock.write():
+            pass
+
+    def test_no_upgrade(self):
+        """
+        tests that a reader cannot take the write lock
+        """
+        lock = ReadWriteLock()
+        with lock.read():
+            self.assertRaises(RuntimeError, lock.acquire_write)
+        with lock.write():
+            pass
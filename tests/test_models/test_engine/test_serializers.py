@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+"""
+This module contains the tests for the FileStorage serializers.
+"""
+
+from datetime import datetime
+import inspect
+import io
+import pep8
+import pickle
+import unittest
+from models.engine import serializers
+from models.engine.file_storage import classes
+from models.review import Review
+from models.state import State
+BinarySerializer = serializers.BinarySerializer
+JSONSerializer = serializers.JSONSerializer
+
+
+class TestSerializersDocs(unittest.TestCase):
+    """
+    checks the documentation and style of the serializers module
+    """
+    def test_pep8_conformance_serializers(self):
+        """
+        tests conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/serializers.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_serializers(self):
+        """
+        tests test conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        test_s = 'tests/test_models/test_engine/test_serializers.py'
+        result = pep8s.check_files([test_s])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_serializers_module_docstring(self):
+        """
+        tests for the presence of a docstring in the module
+        """
+        self.assertIsNot(serializers.__doc__, None,
+                         "serializers.py needs a docstring")
+        self.assertTrue(len(serializers.__doc__) >= 1,
+                        "serializers.py needs a docstring")
+
+    def test_serializers_func_docstrings(self):
+        """
+        tests for the presence of docstrings in the classes and methods
+        """
+        for cls in (JSONSerializer, BinarySerializer,
+                    serializers.Unpickler):
+            self.assertTrue(len(cls.__doc__) >= 1,
+                            "{:s} needs a docstring".format(cls.__name__))
+            for func in inspect.getmembers(cls, inspect.isfunction):
+                self.assertIsNot(func[1].__doc__, None,
+                                 "{:s} method needs a docstring".format(
+                                     func[0]))
+
+
+class TestSerializers(unittest.TestCase):
+    """
+    tests the JSON and binary serializers
+    """
+
+    def roundtrip(self, serializer, objs):
+        """
+        writes objs with serializer and returns what it reads back
+        """
+        f = io.BytesIO() if serializer.mode == "b" else io.StringIO()
+        serializer.write(f, [(type(obj).__name__ + "." + obj.id,
+                              serializer.encode(obj)) for obj in objs])
+        f.seek(0)
+        return dict(serializer.iter_items(f))
+
+    def test_roundtrip(self):
+        """
+        tests that both serializers read back what they wrote
+        """
+        state = State(name="Oklahoma")
+        review = Review(text="Nice", place_id="p", user_id="u",
+                        rating=4.5, tags=["quiet", None, True])
+        for serializer in (JSONSerializer(), BinarySerializer(classes)):
+            items = self.roundtrip(serializer, [state, review])
+            value = items["Review." + review.id]
+            self.assertEqual(value["__class__"], "Review")
+            self.assertEqual(value["rating"], 4.5)
+            self.assertEqual(value["tags"], ["quiet", None, True])
+            loaded = State(**items["State." + state.id])
+            self.assertEqual(loaded.name, "Oklahoma")
+            self.assertEqual(loaded.created_at, state.created_at)
+            self.assertEqual(loaded.updated_at, state.updated_at)
+
+    def test_binary_datetimes(self):
+        """
+        tests that the binary format stores datetimes as microseconds
+        """
+        state = State(name="Oklahoma")
+        state.created_at = datetime(2017, 3, 25, 2, 17, 6, 123456)
+        index, fields = pickle.loads(BinarySerializer(classes).encode(state))
+        self.assertEqual(index, list(classes).index("State"))
+        self.assertEqual(fields["created_at"], 1490408226123456)
+
+    def test_binary_rejects_globals(self):
+        """
+        tests that reading a binary file never loads arbitrary objects
+        """
+        f = io.BytesIO(pickle.dumps(("HBNB", 1, ("State",))) +
+                       pickle.dumps((0, {"id": "1", "x": datetime.now()})))
+        with self.assertRaises(pickle.UnpicklingError):
+            list(BinarySerializer(classes).iter_items(f))
@@ -0,0 +1,219 @@
+#!/usr/bin/python3
+"""
+Contains the TestSQLiteStorageDocs and TestSQLiteStorage classes
+"""
+
+import inspect
+import models
+from models.engine import sqlite_storage
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+import os
+import pep8
+import tempfile
+import threading
+import unittest
+from unittest import mock
+SQLiteStorage = sqlite_storage.SQLiteStorage
+
+
+class TestSQLiteStorageDocs(unittest.TestCase):
+    """
+    tests the documentation and style of SQLiteStorage class
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        sets up the doc tests
+        """
+        cls.sqls_f = inspect.getmembers(SQLiteStorage, inspect.isfunction)
+
+    def test_pep8_conformance_sqlite_storage(self):
+        """
+        tests sqlite_storage conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/sqlite_storage.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_sqlite_storage(self):
+        """
+        tests test_sqlite_storage conformity to PEP8
+        """
+        pep8s = pep8.StyleGuide(quiet=True)
+        checked = ['tests/test_models/test_engine/test_sqlite_storage.py']
+        result = pep8s.check_files(checked)
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_sqlite_storage_module_docstring(self):
+        """
+        tests for the presence of a docstring in the module
+        """
+        self.assertIsNot(sqlite_storage.__doc__, None,
+                         "sqlite_storage.py needs a docstring")
+        self.assertTrue(len(sqlite_storage.__doc__) >= 1,
+                        "sqlite_storage.py needs a docstring")
+
+    def test_sqlite_storage_class_docstring(self):
+        """
+        tests for the presence of a docstring in the class
+        """
+        self.assertIsNot(SQLiteStorage.__doc__, None,
+                         "SQLiteStorage class needs a docstring")
+        self.assertTrue(len(SQLiteStorage.__doc__) >= 1,
+                        "SQLiteStorage class needs a docstring")
+
+    def test_sqls_func_docstrings(self):
+        """
+        tests for the presence of docstrings in the methods
+        """
+        for func in self.sqls_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+@unittest.skipIf(models.storage_t == "db", "models are mapped for MySQL")
+class TestSQLiteStorage(unittest.TestCase):
+    """
+    tests the SQLiteStorage class
+    """
+
+    def setUp(self):
+        """
+        opens a storage on a fresh database file
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "hbnb.db")
+        with mock.patch.dict(os.environ, {"HBNB_SQLITE_DB": path}):
+            self.storage = SQLiteStorage()
+        self.storage.reload()
+
+    def tearDown(self):
+        """
+        closes the storage and removes the database file
+        """
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def test_new_save_get(self):
+        """
+        tests that saved objects can be retrieved by class and id
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        got = self.storage.get(State, state.id)
+        self.assertIsNot(got, state)
+        self.assertEqual(got.to_dict(), state.to_dict())
+        self.assertIsNone(self.storage.get(State, "nope"))
+        self.assertIsNone(self.storage.get(int, state.id))
+
+    def test_all_and_count(self):
+        """
+        tests that 'all' and 'count' see pending and saved objects
+        """
+        state = State(name="Oklahoma")
+        city = City(name="Tulsa", state_id=state.id)
+        self.storage.new(state)
+        self.storage.new(city)
+        self.assertEqual(list(self.storage.all(State)), ["State." + state.id])
+        self.assertEqual(self.storage.count(City), 1)
+        self.assertEqual(self.storage.count(), 2)
+        self.assertEqual(len(self.storage.all()), 2)
+
+    def test_close_discards_uncommitted(self):
+        """
+        tests that 'close' rolls back changes that were not saved
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.count(State)
+        self.storage.close()
+        self.assertEqual(self.storage.count(State), 0)
+
+    def test_delete(self):
+        """
+        tests that 'delete' removes the object at the next save
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.delete(state)
+        self.storage.save()
+        self.storage.close()
+        self.assertIsNone(self.storage.get(State, state.id))
+
+    def test_related(self):
+        """
+        tests that 'related' looks objects up by foreign key
+        """
+        place = Place(name="Cabin")
+        reviews = [Review(place_id=place.id, user_id="u", text=str(i))
+                   for i in range(3)]
+        for obj in [place, Review(place_id="other", text="x")] + reviews:
+            self.storage.new(obj)
+        self.storage.save()
+        self.storage.close()
+        found = self.storage.related(Review, "place_id", place.id)
+        self.assertEqual(sorted(r.text for r in found), ["0", "1", "2"])
+        self.assertEqual(self.storage.related(Review, "text", "0"), [])
+
+    def test_page(self):
+        """
+        tests that 'page' returns objects in id order after a cursor,
+        optionally by foreign key
+        """
+        state = State(name="Oklahoma")
+        cities = [City(name=str(i), state_id=state.id) for i in range(5)]
+        for obj in [state, City(name="x", state_id="other")] + cities:
+            self.storage.new(obj)
+        ids = sorted(city.id for city in cities)
+        first = self.storage.page(City, 2, attr="state_id", value=state.id)
+        self.assertEqual([city.id for city in first], ids[:2])
+        rest = self.storage.page(City, 10, ids[1], "state_id", state.id)
+        self.assertEqual([city.id for city in rest], ids[2:])
+        self.assertEqual(len(self.storage.page(City, 10)), 6)
+        self.assertEqual(self.storage.page(City, 10, attr="name",
+                                           value="x"), [])
+
+    def test_touch(self):
+        """
+        tests that attribute changes of loaded objects are saved
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.save()
+        self.storage.close()
+        got = self.storage.get(State, state.id)
+        got.name = "Texas"
+        self.storage.touch(got, "name")
+        self.storage.save()
+        self.storage.close()
+        self.assertEqual(self.storage.get(State, state.id).name, "Texas")
+
+    def test_threads_have_own_sessions(self):
+        """
+        tests that each thread sees only committed changes of the others
+        """
+        state = State(name="Oklahoma")
+        self.storage.new(state)
+        self.storage.count(State)
+        counts = []
+
+        def count():
+            """
+            counts states from another thread
+            """
+            counts.append(self.storage.count(State))
+            self.storage.close()
+        thread = threading.Thread(target=count)
+        thread.start()
+        thread.join()
+        self.assertEqual(counts, [0])